@@ -1,1018 +1,1347 @@
-# app.py — YouTube Hot Finder (simple globalized)
-# - 입력 탭: 원문 키워드 → 실시간 번역(예: ko→ja), "번역을 검색에 사용" 체크 시 번역본으로 검색
-# - 설정 탭: 국가 범위(한국만/해외만/한국+해외)만 선택 — 중복되는 언어/국가 입력 제거
-# - 결과 테이블: 헤더 정렬 + hover 미리보기 (JS, rerun 없음)
-# - 제목 한국어 번역: 제목 아래 한 줄/툴팁 옵션 추가 (캐시)
-# - 키워드 엄격 필터(제목/설명/태그), Excel, Transcript(SRT/ZIP), 쿼터 추적
-# - Windows 친화, pyarrow 미사용
-
-import os
-import time
-import json
-import math
-import requests
-import pandas as pd
-from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any, Tuple
-
-import streamlit as st
-import streamlit.components.v1 as components
-
-# -----------------------------------------------------------------------------
-# Page config
-# -----------------------------------------------------------------------------
-st.set_page_config(page_title="YouTube Hot Finder", layout="wide")
-
-# -----------------------------------------------------------------------------
-# Constants / Config
-# -----------------------------------------------------------------------------
-API_BASE = "https://www.googleapis.com/youtube/v3"
-DEFAULT_DAILY_QUOTA = 10_000
-CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".youtube_hot_finder.json")
-
-LANG_NAME = {
-    "ko": "Korean", "en": "English", "ja": "Japanese", "zh": "Chinese",
-    "es": "Spanish", "de": "German", "fr": "French", "pt": "Portuguese"
-}
-FOREIGN_PRESET = ["US", "JP", "TW", "HK", "SG", "GB", "DE", "FR", "ES", "BR"]  # 해외 프리셋
-
-# -----------------------------------------------------------------------------
-# API key: 저장/불러오기 및 안전 로딩
-# -----------------------------------------------------------------------------
-def load_api_key_from_disk() -> Optional[str]:
-    try:
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return str(data.get("api_key") or "").strip()
-    except Exception:
-        pass
-    return None
-
-def save_api_key_to_disk(key: str) -> bool:
-    try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump({"api_key": key}, f)
-        return True
-    except Exception:
-        return False
-
-def delete_api_key_on_disk() -> bool:
-    try:
-        if os.path.exists(CONFIG_PATH):
-            os.remove(CONFIG_PATH)
-        return True
-    except Exception:
-        return False
-
-def _load_api_keys_safely() -> List[str]:
-    """환경변수 → secrets → 로컬 저장 순으로 다중/단일 키를 수집하고 중복 제거."""
-    keys: List[str] = []
-
-    # 1) 환경변수 (다중/단일)
-    env_multi = os.getenv("YOUTUBE_API_KEYS", "")
-    if env_multi.strip():
-        keys += [k.strip() for k in env_multi.split(",") if k.strip()]
-    env_single = os.getenv("YOUTUBE_API_KEY", "")
-    if env_single.strip():
-        keys.append(env_single.strip())
-
-    # 2) secrets.toml (없어도 예외 안터지게 보호)
-    try:
-        sec = st.secrets
-        if "YOUTUBE_API_KEYS" in sec:
-            v = sec["YOUTUBE_API_KEYS"]
-            if isinstance(v, (list, tuple)):
-                keys += [str(x).strip() for x in v if str(x).strip()]
-            else:
-                keys += [x.strip() for x in str(v).split(",") if x.strip()]
-        if "YOUTUBE_API_KEY" in sec:
-            keys.append(str(sec["YOUTUBE_API_KEY"]).strip())
-    except Exception:
-        pass
-
-    # 3) 로컬 저장
-    if not keys:
-        dk = load_api_key_from_disk()
-        if dk:
-            keys = [dk]
-
-    # 중복 제거(순서 유지)
-    seen, uniq = set(), []
-    for k in keys:
-        if k and k not in seen:
-            seen.add(k); uniq.append(k)
-    return uniq
-
-def rotate_api_key() -> bool:
-    keys = st.session_state.get("api_keys", [])
-    if not keys:
-        return False
-    i = (st.session_state.get("api_key_idx", 0) + 1) % len(keys)
-    st.session_state["api_key_idx"] = i
-    st.session_state["api_key"] = keys[i]
-    return True
-
-# 최초 세션 세팅
-if "api_keys" not in st.session_state:
-    _keys = _load_api_keys_safely()
-    st.session_state["api_keys"] = _keys
-    st.session_state["api_key_idx"] = 0
-    st.session_state["api_key"] = (_keys[0] if _keys else (load_api_key_from_disk() or ""))
-
-# -----------------------------------------------------------------------------
-# Session defaults
-# -----------------------------------------------------------------------------
-st.session_state.setdefault("q_calls", {"search": 0, "videos": 0, "channels": 0})
-st.session_state.setdefault("q_units", 0)
-st.session_state.setdefault("q_log", [])
-st.session_state.setdefault("api_waiting", False)
-st.session_state.setdefault("api_wait_reason", "")
-st.session_state.setdefault("results_df", pd.DataFrame())
-st.session_state.setdefault("payload_cache", [])
-st.session_state.setdefault("lang_pref", "ko")
-
-if "api_key" not in st.session_state:
-    st.session_state["api_key"] = load_api_key_from_disk() or ""
-
-def _quota_units_for(endpoint_name: str) -> int:
-    if endpoint_name.startswith("search"): return 100
-    if endpoint_name.startswith("videos"): return 1
-    if endpoint_name.startswith("channels"): return 1
-    return 0
-
-def _record_quota(endpoint_name: str, path: str) -> None:
-    units = _quota_units_for(endpoint_name)
-    if endpoint_name.startswith("search"):
-        st.session_state["q_calls"]["search"] += 1
-    elif endpoint_name.startswith("videos"):
-        st.session_state["q_calls"]["videos"] += 1
-    elif endpoint_name.startswith("channels"):
-        st.session_state["q_calls"]["channels"] += 1
-    st.session_state["q_units"] += units
-    st.session_state["q_log"].append((endpoint_name, units, path, time.time()))
-
-# -----------------------------------------------------------------------------
-# Translator (cached with fallback)
-# -----------------------------------------------------------------------------
-@st.cache_data(show_spinner=False)
-def translate_keyword_once(src_text: str, src_lang: str, tgt_lang: str) -> str:
-    s = (src_text or "").strip()
-    if not s or src_lang == tgt_lang:
-        return s
-    # 1) googletrans
-    try:
-        from googletrans import Translator
-        return Translator().translate(s, src=src_lang, dest=tgt_lang).text
-    except Exception:
-        pass
-    # 2) deep-translator
-    try:
-        from deep_translator import GoogleTranslator as DTGoogle
-        return DTGoogle(source=src_lang, target=tgt_lang).translate(s)
-    except Exception:
-        return s  # 실패 시 원문
-
-def translate_keywords_list(keywords: List[str], src_lang: str, tgt_lang: str) -> List[str]:
-    outs: List[str] = []
-    seen = set()
-    for k in [x.strip() for x in keywords if x and x.strip()]:
-        v = translate_keyword_once(k, src_lang, tgt_lang).strip()
-        if v and v.lower() not in seen:
-            seen.add(v.lower()); outs.append(v)
-    return outs
-
-# ▼ 제목 한국어 번역(캐시) — googletrans → deep-translator 순서로 시도, 실패 시 원문 반환
-@st.cache_data(show_spinner=False)
-def translate_to_ko_once(text: str) -> str:
-    s = (text or "").strip()
-    if not s:
-        return s
-    try:
-        from googletrans import Translator
-        return Translator().translate(s, dest="ko").text
-    except Exception:
-        pass
-    try:
-        from deep_translator import GoogleTranslator as DTGoogle
-        return DTGoogle(source="auto", target="ko").translate(s)
-    except Exception:
-        return s
-
-# -----------------------------------------------------------------------------
-# YouTube API helpers (쿼터 초과 시 자동 로테이션)
-# -----------------------------------------------------------------------------
-def yt_get(endpoint: str, params: Dict[str, Any], api_key: str,
-           wait_minutes: float = 0.0, max_retries: int = 2) -> Dict[str, Any]:
-    # 항상 현재 회전키 우선
-    params = {**params, "key": st.session_state.get("api_key", api_key)}
-
-    tries = 0
-    while True:
-        r = requests.get(f"{API_BASE}/{endpoint}", params=params, timeout=30)
-        if r.status_code == 200:
-            _record_quota(endpoint, r.url)
-            return r.json()
-
-        tries += 1
-
-        # 에러 이유 추출(가능하면)
-        try:
-            body = r.json()
-            err_reason = (
-                (body.get("error", {}).get("errors", [{}])[0].get("reason"))
-                or body.get("error", {}).get("message", "")
-                or r.text
-            )
-        except Exception:
-            err_reason = r.text
-
-        qwords = ("quota", "daily", "rate", "exceed")  # quotaExceeded 등 포괄
-        is_quota = (r.status_code in (403, 429) and any(k in str(err_reason).lower() for k in qwords))
-
-        if is_quota:
-            # 1) API 키 로테이션 1회 즉시 재시도
-            if rotate_api_key():
-                params_retry = {**params, "key": st.session_state.get("api_key")}
-                r2 = None
-                try:
-                    r2 = requests.get(f"{API_BASE}/{endpoint}", params=params_retry, timeout=30)
-                except Exception:
-                    r2 = None
-
-                if r2 is not None and r2.status_code == 200:
-                    _record_quota(endpoint, r2.url)
-                    return r2.json()
-
-                # 실패한 경우 err_reason 업데이트(가능하면)
-                try:
-                    body2 = r2.json() if r2 is not None else {}
-                    err_reason = (
-                        (body2.get("error", {}).get("errors", [{}])[0].get("reason"))
-                        or body2.get("error", {}).get("message", "")
-                        or err_reason
-                    )
-                except Exception:
-                    pass
-
-            # 2) (옵션) 대기 후 재시도
-            if wait_minutes > 0 and tries <= max_retries:
-                st.session_state["api_waiting"] = True
-                st.session_state["api_wait_reason"] = f"{endpoint}: {err_reason}"
-                wait_secs = int(wait_minutes * 60)
-                with st.status("API 쿼터 초과로 대기 중…", expanded=True) as stat:
-                    for s in range(wait_secs, 0, -1):
-                        stat.update(label=f"API 대기 {s}초 남음 (사유: {err_reason})")
-                        time.sleep(1)
-                st.session_state["api_waiting"] = False
-                continue  # while 루프 재시도
-
-        # 다른 에러거나 재시도 불가면 즉시 예외
-        raise RuntimeError(f"YouTube API error {r.status_code}: {r.text}")
-
-def iso8601_to_seconds(duration: str) -> int:
-    import re
-    m = re.fullmatch(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
-    if not m:
-        return 0
-    h = int(m.group(1) or 0); m_ = int(m.group(2) or 0); s = int(m.group(3) or 0)
-    return h * 3600 + m_ * 60 + s
-
-def batched(iterable: List[Any], n: int):
-    batch = []
-    for x in iterable:
-        batch.append(x)
-        if len(batch) == n:
-            yield batch
-            batch = []
-    if batch:
-        yield batch
-
-def fetch_videos_by_search(
-    api_key: str, query: Optional[str] = None, channel_id: Optional[str] = None,
-    region_code: Optional[str] = None, relevance_language: Optional[str] = None,
-    published_after: Optional[str] = None, max_results: int = 100,
-    order: str = "viewCount", wait_minutes: float = 0.0
-) -> List[str]:
-    effective_order = "date" if (published_after and order != "date") else order
-    ids: List[str] = []
-    params = {"part": "snippet", "type": "video", "maxResults": 50, "order": effective_order}
-    if query: params["q"] = query
-    if channel_id: params["channelId"] = channel_id
-    if region_code: params["regionCode"] = region_code
-    if relevance_language: params["relevanceLanguage"] = relevance_language
-    if published_after: params["publishedAfter"] = published_after
-
-    next_page = None
-    while True:
-        if next_page:
-            params["pageToken"] = next_page
-        data = yt_get("search", params, api_key, wait_minutes=wait_minutes)
-        for item in data.get("items", []):
-            vid = item["id"]["videoId"]
-            ids.append(vid)
-            if len(ids) >= max_results:
-                return ids
-        next_page = data.get("nextPageToken")
-        if not next_page:
-            break
-    return ids
-
-def fetch_video_details(api_key: str, video_ids: List[str], wait_minutes: float = 0.0) -> Dict[str, Any]:
-    details: Dict[str, Any] = {}
-    if not video_ids:
-        return details
-    for batch in batched(video_ids, 50):
-        data = yt_get("videos", {"part": "snippet,contentDetails,statistics", "id": ",".join(batch)}, api_key, wait_minutes=wait_minutes)
-        for item in data.get("items", []):
-            details[item["id"]] = item
-    return details
-
-def fetch_channel_subs(api_key: str, channel_ids: List[str], wait_minutes: float = 0.0) -> Dict[str, int]:
-    subs: Dict[str, int] = {}
-    if not channel_ids:
-        return subs
-    for batch in batched(channel_ids, 50):
-        data = yt_get("channels", {"part": "statistics", "id": ",".join(batch)}, api_key, wait_minutes=wait_minutes)
-        for item in data.get("items", []):
-            subs[item["id"]] = int(item["statistics"].get("subscriberCount", 0))
-    return subs
-
-def compute_metrics(detail: Dict[str, Any]) -> Dict[str, Any]:
-    snip = detail["snippet"]; stats = detail.get("statistics", {}); content = detail.get("contentDetails", {})
-    published_dt = datetime.fromisoformat(snip["publishedAt"].replace('Z', '+00:00'))
-    now = datetime.now(timezone.utc)
-    hours_since = max((now - published_dt).total_seconds() / 3600.0, 1e-6)
-    views = int(stats.get("viewCount", 0)); vph = views / hours_since
-    dur_sec = iso8601_to_seconds(content.get("duration", "PT0S"))
-    return {"publishedAt": published_dt, "views": views, "viewsPerHour": vph, "durationSec": dur_sec}
-
-def human_duration(seconds: int) -> str:
-    h = seconds // 3600; m = (seconds % 3600) // 60; s = seconds % 60
-    if h:
-        return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
-    return f"{int(m):02d}:{int(s):02d}"
-
-def filter_duration_mode(dur_sec: int, mode: str, shorts_sec: int = 60) -> bool:
-    if mode == "둘다": return True
-    if mode == "쇼츠": return dur_sec < shorts_sec
-    if mode == "롱폼": return dur_sec >= shorts_sec
-    return True
-
-def parse_list_field(txt: Optional[str]) -> List[str]:
-    if not txt:
-        return []
-    return [p.strip() for part in txt.split(",") for p in part.split() if p.strip()]
-
-# -----------------------------------------------------------------------------
-# 키워드 엄격 필터
-# -----------------------------------------------------------------------------
-def normalize_text(s: str) -> str:
-    return (s or "").lower()
-
-def contains_keywords(text: str, keywords: List[str], mode: str) -> bool:
-    if not keywords:
-        return True
-    t = normalize_text(text)
-    ks = [normalize_text(k) for k in keywords if k.strip()]
-    if mode == "all":
-        return all(k in t for k in ks)
-    else:
-        return any(k in t for k in ks)
-
-# -----------------------------------------------------------------------------
-# HTML/JS component (table + preview) — 한국어 번역 표시/툴팁 옵션 통합
-# -----------------------------------------------------------------------------
-def build_component_html(payload: List[Dict[str, Any]], show_ko: bool = True, tooltip_ko: bool = True) -> str:
-    tpl = r"""
-<div id="app-root"></div>
-<script type="application/json" id="data">__DATA__</script>
-<style>
-:root { --bg:#fff; --fg:#0f172a; --muted:#475569; --border:#e5e7eb; --thead-bg:#f3f4f6; --thead-fg:#0f172a; --row-hover:#f8fafc; }
-@media (prefers-color-scheme: dark){ :root{ --bg:#0b1020; --fg:#f8fafc; --muted:#cbd5e1; --border:#334155; --thead-bg:#1f2937; --thead-fg:#f8fafc; --row-hover:#111827; } }
-html,body{background:transparent;color:var(--fg);font-family:ui-sans-serif,system-ui,-apple-system,Segoe UI,Roboto,Helvetica,Arial;}
-.container{display:grid;grid-template-columns:85% 15%;gap:12px;height:640px;}
-.table-wrap{border:1px solid var(--border);border-radius:10px;overflow:hidden;display:flex;flex-direction:column;min-width:0;}
-.table-head{background:var(--thead-bg);color:var(--thead-fg);padding:6px 10px;font-weight:700;border-bottom:1px solid var(--border);font-size:13px;}
-.table-scroll{overflow:auto;height:100%;}
-table{width:100%;border-collapse:collapse;table-layout:fixed;}
-th,td{border-bottom:1px solid var(--border);padding:6px 8px;font-size:12px;text-align:left;}
-th{position:sticky;top:0;background:var(--thead-bg);color:var(--thead-fg);z-index:2;cursor:pointer;user-select:none;}
-tr:hover td{background:var(--row-hover);}
-th .caret{opacity:.6;margin-left:4px;}
-colgroup col.title{width:24%;} colgroup col.channel{width:14%;} colgroup col.uploaded{width:13%;}
-colgroup col.views{width:10%;} colgroup col.vph{width:10%;} colgroup col.subs{width:10%;}
-colgroup col.vs{width:9%;} colgroup col.dur{width:10%;}
-td.title,th.title{white-space:normal;word-break:break-word;line-height:1.25;font-size:11.5px;}
-td.title .title-ko{display:block;color:var(--muted);font-size:11px;margin-top:2px;} /* 번역 줄 */
-td:not(.title),th:not(.title){white-space:nowrap;}
-.preview{border:1px solid var(--border);border-radius:10px;padding:8px;}
-.preview .img-wrap{display:flex;justify-content:center;}
-.preview img{width:100%;max-width:200px;height:auto;border-radius:6px;border:1px solid var(--border);display:block;}
-.meta{font-size:11px;color:var(--muted);}
-.title-pv{font-weight:700;margin:6px 0 4px 0;font-size:12px;}
-.link a{color:inherit;text-decoration:underline;font-size:12px;}
-.badge{display:inline-block;padding:1px 5px;border:1px solid var(--border);border-radius:6px;font-size:11px;margin-right:4px;}
-</style>
-<script>
-(function(){
-  const root = document.getElementById('app-root');
-  const data = JSON.parse(document.getElementById('data').textContent || "[]");
-
-  // ▼ 파이썬에서 내려준 옵션
-  const SHOW_KO = __SHOW_KO__;
-  const TOOLTIP_KO = __TOOLTIP_KO__;
-
-  const columns = [
-    {key:'title',label:'Video Title',type:'str',className:'title'},
-    {key:'channel',label:'Channel',type:'str',className:'channel'},
-    {key:'uploaded',label:'Uploaded',type:'time',sortKey:'uploaded_ts',className:'uploaded'},
-    {key:'views',label:'Views',type:'num',className:'views'},
-    {key:'vph',label:'Views/hr',type:'num',className:'vph'},
-    {key:'subs',label:'Subscribers',type:'num',className:'subs'},
-    {key:'vs',label:'Views/Subscribers',type:'num',className:'vs'},
-    {key:'duration',label:'Duration',type:'dur',sortKey:'duration_sec',className:'dur'},
-  ];
-  const fmtInt = (n)=> (n==null||isNaN(n))? '' : Number(n).toLocaleString();
-  const fmtNum = (n)=> (n==null||isNaN(n))? '' : (Math.round(n*100)/100).toLocaleString();
-
-  let sortKey='vph', sortDir=-1, rows=data.slice();
-  function sortRows(){
-    rows.sort((a,b)=>{
-      const col = columns.find(c=>c.key===sortKey)||{};
-      const key = col.sortKey||col.key||sortKey;
-      let av=a[key]; let bv=b[key];
-      if(av==null) av=-Infinity; if(bv==null) bv=-Infinity;
-      if(typeof av==='string' && typeof bv==='string'){ return sortDir * av.localeCompare(bv); }
-      return sortDir * ((+av)-(+bv));
-    });
-  }
-  sortRows();
-
-  const container=document.createElement('div'); container.className='container';
-  const tableWrap=document.createElement('div'); tableWrap.className='table-wrap';
-  const head=document.createElement('div'); head.className='table-head'; head.textContent='Hot Videos';
-  const scroll=document.createElement('div'); scroll.className='table-scroll';
-  const table=document.createElement('table');
-
-  const colg=document.createElement('colgroup');
-  ['title','channel','uploaded','views','vph','subs','vs','dur'].forEach(c=>{const col=document.createElement('col'); col.className=c; colg.appendChild(col);});
-  table.appendChild(colg);
-
-  const thead=document.createElement('thead'); const trh=document.createElement('tr');
-  columns.forEach(col=>{
-    const th=document.createElement('th'); th.className=col.className||''; th.textContent=col.label;
-    const caret=document.createElement('span'); caret.className='caret'; caret.textContent=(sortKey===col.key?(sortDir===-1?'▼':'▲'):''); th.appendChild(caret);
-    th.addEventListener('click',()=>{ if(sortKey===col.key){sortDir*=-1;} else {sortKey=col.key; sortDir=-1;}
-      [...thead.querySelectorAll('th .caret')].forEach(c=>c.textContent=''); caret.textContent=(sortDir===-1?'▼':'▲'); sortRows(); renderBody();});
-    trh.appendChild(th);
-  });
-  thead.appendChild(trh); table.appendChild(thead);
-  const tbody=document.createElement('tbody'); table.appendChild(tbody); scroll.appendChild(table);
-  tableWrap.appendChild(head); tableWrap.appendChild(scroll);
-
-  const preview=document.createElement('div'); preview.className='preview';
-  const imgWrap=document.createElement('div'); imgWrap.className='img-wrap';
-  const pvImg=document.createElement('img'); imgWrap.appendChild(pvImg);
-  const pvTitle=document.createElement('div'); pvTitle.className='title-pv';
-  const pvMeta=document.createElement('div'); pvMeta.className='meta';
-  const pvBadges=document.createElement('div');
-  const pvLink=document.createElement('div'); pvLink.className='link';
-  preview.appendChild(imgWrap); preview.appendChild(pvTitle); preview.appendChild(pvMeta); preview.appendChild(pvBadges); preview.appendChild(pvLink);
-
-  container.appendChild(tableWrap); container.appendChild(preview); root.appendChild(container);
-
-  function escapeHtml(s){ return (s==null?'':String(s)).replace(/[&<>"']/g,m=>({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'}[m])); }
-
-  function rowHTML(r){
-    // 제목 본문 + 번역 줄 구성
-    let titleInner = escapeHtml(r.title);
-    if (SHOW_KO && r.title_ko && r.title_ko !== r.title){
-      titleInner += '<span class="title-ko">'+escapeHtml(r.title_ko)+'</span>';
-    }
-    const titleAttr = TOOLTIP_KO && r.title_ko ? r.title_ko : r.title;
-
-    return '<tr data-vid="'+r.vid+'">'
-      + '<td class="title" title="'+escapeHtml(titleAttr)+'">'+titleInner+'</td>'
-      + '<td class="channel" title="'+escapeHtml(r.channel)+'">'+escapeHtml(r.channel)+'</td>'
-      + '<td class="uploaded" data-sort="'+r.uploaded_ts+'">'+escapeHtml(r.uploaded)+'</td>'
-      + '<td class="views" data-sort="'+r.views+'">'+fmtInt(r.views)+'</td>'
-      + '<td class="vph" data-sort="'+r.vph+'">'+fmtNum(r.vph)+'</td>'
-      + '<td class="subs" data-sort="'+r.subs+'">'+fmtInt(r.subs)+'</td>'
-      + '<td class="vs" data-sort="'+(r.vs==null?'':r.vs)+'">'+(r.vs==null?'':r.vs)+'</td>'
-      + '<td class="dur" data-sort="'+r.duration_sec+'">'+escapeHtml(r.duration)+'</td>'
-      + '</tr>';
-  }
-
-  function renderBody(){
-    tbody.innerHTML = rows.map(rowHTML).join('');
-    Array.prototype.forEach.call(tbody.querySelectorAll('tr'), function(tr){
-      tr.addEventListener('mouseenter', function(){
-        const vid=tr.getAttribute('data-vid'); const r=rows.find(x=>x.vid===vid); if(!r) return;
-        pvImg.src=r.thumb; pvTitle.textContent=r.title; pvMeta.textContent=r.channel+' · '+r.uploaded;
-        pvBadges.innerHTML = '<span class="badge">Views: '+fmtInt(r.views)+'</span>'
-          + '<span class="badge">VPH: '+fmtNum(r.vph)+'</span>'
-          + '<span class="badge">Subs: '+fmtInt(r.subs)+'</span>'
-          + (r.vs!=null?'<span class="badge">V/Sub: '+r.vs+'</span>':'')
-          + '<span class="badge">Dur: '+r.duration+'</span>';
-        pvLink.innerHTML = '<a href="'+r.url+'" target="_blank" rel="noreferrer">▶ Open on YouTube</a>';
-      }, {passive:true});
-    });
-  }
-  renderBody();
-
-  if(rows.length){
-    const r=rows[0]; pvImg.src=r.thumb; pvTitle.textContent=r.title; pvMeta.textContent=r.channel+' · '+r.uploaded;
-    pvBadges.innerHTML = '<span class="badge">Views: '+fmtInt(r.views)+'</span>'
-      + '<span class="badge">VPH: '+fmtNum(r.vph)+'</span>'
-      + '<span class="badge">Subs: '+fmtInt(r.subs)+'</span>'
-      + (r.vs!=null?'<span class="badge">V/Sub: '+r.vs+'</span>':'')
-      + '<span class="badge">Dur: '+r.duration+'</span>';
-    pvLink.innerHTML = '<a href="'+r.url+'" target="_blank" rel="noreferrer">▶ Open on YouTube</a>';
-  }
-})();
-</script>
-"""
-    data_json = json.dumps(payload, ensure_ascii=False).replace("</", "<\\/")
-    return (tpl
-            .replace("__DATA__", data_json)
-            .replace("__SHOW_KO__", "true" if show_ko else "false")
-            .replace("__TOOLTIP_KO__", "true" if tooltip_ko else "false"))
-
-# -----------------------------------------------------------------------------
-# Transcript helpers
-# -----------------------------------------------------------------------------
-def _format_srt_time(seconds: float) -> str:
-    ms = int(round((seconds - int(seconds)) * 1000))
-    total = int(seconds)
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-
-@st.cache_data(show_spinner=False)
-def fetch_transcript_srt(video_id: str, lang_pref: str = "ko") -> Optional[str]:
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-    except Exception:
-        return None
-    langs = []
-    if lang_pref:
-        langs.append(lang_pref)
-        if "-" in lang_pref:
-            langs.append(lang_pref.split("-")[0])
-    for extra in ["en", "ko"]:
-        if extra not in langs:
-            langs.append(extra)
-    try:
-        list_obj = YouTubeTranscriptApi.list_transcripts(video_id)
-        segs = None
-        for lp in langs:
-            try:
-                tr = list_obj.find_transcript([lp])
-                segs = tr.fetch()
-                break
-            except Exception:
-                pass
-        if segs is None:
-            try:
-                tr = list_obj.find_transcript(list_obj._generated_transcripts_language_codes)
-                tr = tr.translate(langs[0]); segs = tr.fetch()
-            except Exception:
-                return None
-    except Exception:
-        return None
-
-    lines = []
-    for idx, seg in enumerate(segs, start=1):
-        start = float(seg.get("start", 0.0)); dur = float(seg.get("duration", 0.0)); end = start + dur
-        text = (seg.get("text") or "").replace("\n", " ").strip()
-        lines.append(str(idx)); lines.append(f"{_format_srt_time(start)} --> {_format_srt_time(end)}")
-        lines.append(text if text else ""); lines.append("")
-    return "\n".join(lines) if lines else None
-
-def _safe_filename(s: str) -> str:
-    bad = '<>:"/\\|?*'
-    out = "".join(c for c in s if c not in bad)
-    return out[:120].strip() or "video"
-
-@st.cache_data(show_spinner=False)
-def build_transcripts_zip_cached(vids: Tuple[str, ...], labels: Tuple[str, ...], lang_pref: str) -> bytes:
-    from io import BytesIO; import zipfile
-    buf = BytesIO(); missing = []
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for label, vid in zip(labels, vids):
-            srt = fetch_transcript_srt(vid, lang_pref=lang_pref)
-            if srt:
-                fn = _safe_filename(label)[:100] + ".srt"; zf.writestr(fn, srt)
-            else:
-                missing.append(label)
-        if missing:
-            zf.writestr("README.txt", "No transcript for:\n\n" + "\n".join(f"- {m}" for m in missing))
-    return buf.getvalue()
-
-# -----------------------------------------------------------------------------
-# UI
-# -----------------------------------------------------------------------------
-st.title("🔥 YouTube Hot Finder")
-
-# Live quota header
-quota_box = st.container()
-def render_quota_header():
-    used = st.session_state["q_units"]
-    left = max(DEFAULT_DAILY_QUOTA - used, 0)
-    p = min(used / DEFAULT_DAILY_QUOTA, 1.0)
-    with quota_box:
-        st.progress(p, text=f"일일 쿼터 사용량: {used:,} / {DEFAULT_DAILY_QUOTA:,}  (남음 {left:,})")
-        c1, c2, c3, c4 = st.columns(4)
-        c1.metric("search.list calls", f"{st.session_state['q_calls']['search']}")
-        c2.metric("videos.list calls", f"{st.session_state['q_calls']['videos']}")
-        c3.metric("channels.list calls", f"{st.session_state['q_calls']['channels']}")
-        c4.metric("총 유닛", f"{used:,}")
-render_quota_header()
-
-tab_input, tab_settings, tab_results = st.tabs(["키워드·채널 입력", "설정", "결과"])
-
-# ----------------------- Input Tab -----------------------
-with tab_input:
-    st.subheader("키워드 / 채널핸들 입력")
-
-    col_sel1, col_sel2, col_chk = st.columns([0.25, 0.25, 0.5])
-    with col_sel1:
-        st.selectbox("입력 언어", ["ko", "en", "ja", "zh", "es", "de", "fr", "pt"], index=0, key="live_src")
-    with col_sel2:
-        st.selectbox("변환 언어", ["ja", "ko", "en", "zh", "es", "de", "fr", "pt"], index=0, key="live_dst")
-    with col_chk:
-        st.checkbox("번역본을 검색에 사용(원문 대신)", value=True, key="live_replace")
-
-    c1, c2 = st.columns(2)
-    with c1:
-        st.text_area("키워드(원문: 쉼표/스페이스/줄바꿈 구분)", key="kw_src", height=80, placeholder="예: 시니어, 황혼")
-
-    src_list = parse_list_field(st.session_state.get("kw_src", ""))
-    dst_list = translate_keywords_list(src_list, st.session_state["live_src"], st.session_state["live_dst"])
-    with c2:
-        st.text_area(f"키워드(변환: {st.session_state['live_dst']})", value=", ".join(dst_list), height=80, disabled=True)
-
-    st.session_state["effective_keywords"] = dst_list if st.session_state["live_replace"] else src_list
-    st.session_state["effective_lang"] = st.session_state["live_dst"] if st.session_state["live_replace"] else st.session_state["live_src"]
-
-    st.text_area("채널 핸들 또는 채널 ID (쉼표/스페이스/줄바꿈 구분)", key="channels_input", height=80, placeholder="@channel 또는 UCxxxxx")
-
-# ----------------------- Settings Tab -----------------------
-with tab_settings:
-    st.subheader("설정")
-
-    # --- API 키 입력/관리 ---
-    current_keys = st.session_state.get("api_keys", [])
-    current_display = ",".join(current_keys) if current_keys else st.session_state.get("api_key", "")
-    user_key = st.text_input(
-        "YouTube Data API v3 키 (쉼표로 여러 개 입력 가능)",
-        value=str(current_display),
-        type="password",
-        key="api_key_input",
-        help="예) key1,key2,key3  → 쿼터 초과 시 자동 로테이션"
-    )
-
-    # 입력값 반영 (쉼표 분리 다중키 지원)
-    if user_key is not None:
-        parsed = [k.strip() for k in user_key.split(",") if k.strip()]
-        if parsed:
-            st.session_state["api_keys"] = parsed
-            st.session_state["api_key_idx"] = 0
-            st.session_state["api_key"] = parsed[0]
-        else:
-            st.session_state["api_keys"] = []
-            st.session_state["api_key_idx"] = 0
-            st.session_state["api_key"] = ""
-
-    c1, c2, c3 = st.columns([0.25, 0.25, 0.5])
-    if c1.button("API 키 저장"):
-        if st.session_state.get("api_key", ""):
-            ok = save_api_key_to_disk(st.session_state["api_key"])
-            st.success("로컬에 저장했습니다." if ok else "저장 실패")
-        else:
-            st.warning("저장할 키가 없습니다.")
-    if c2.button("API 키 삭제"):
-        ok = delete_api_key_on_disk()
-        if ok:
-            st.session_state["api_keys"] = []
-            st.session_state["api_key_idx"] = 0
-            st.session_state["api_key"] = ""
-            st.success("로컬 저장 키를 삭제했습니다.")
-        else:
-            st.warning("삭제 실패 또는 저장된 키가 없습니다.")
-    c3.caption(f"로컬 저장 위치: `{CONFIG_PATH}` (개인 PC 외 저장은 권장하지 않음)")
-
-    # 검색/필터 옵션
-    st.selectbox("실행모드", ["채널", "키워드", "둘다"], index=2, key="run_mode")
-    st.selectbox("쇼츠/롱폼", ["쇼츠", "롱폼", "둘다"], key="form_factor")
-    st.number_input("쇼츠 기준(초)", min_value=10, max_value=300, value=60, step=5, key="shorts_sec")
-    st.number_input("최근 몇일간의 영상을 분석할까요", min_value=1, max_value=3650, value=180, key="days_back")
-    st.number_input("채널당 최대 검색 수", min_value=10, max_value=1000, value=200, step=10, key="per_channel_max")
-    st.number_input("검색어당 최대 검색수", min_value=10, max_value=1000, value=200, step=10, key="per_keyword_max")
-    st.number_input("최소 시간당 조회수", min_value=0.0, value=0.0, step=10.0, key="min_vph")
-    st.number_input("API키 쿼터 소진 시 대기시간(분)", min_value=0.0, value=0.0, step=0.5, key="wait_minutes")
-    st.checkbox("테스트용: 길이/시간당 조회수 필터 무시", value=False, key="ignore_filters")
-
-    # 국가 범위만 선택(심플)
-    st.markdown("### 🌐 국가 범위")
-    scope = st.radio("검색 범위", ["한국만", "해외만", "한국+해외"], index=2, horizontal=True, key="region_scope")
-    overseas_regions = []
-    if scope in ("해외만", "한국+해외"):
-        overseas_regions = st.multiselect("해외 국가 선택", options=FOREIGN_PRESET, default=FOREIGN_PRESET, key="overseas_regions")
-    target_regions = (["KR"] if scope in ("한국만", "한국+해외") else []) + (overseas_regions if scope in ("해외만", "한국+해외") else [])
-    st.session_state["target_regions"] = target_regions
-
-    # 키워드 엄격 필터 옵션
-    st.markdown("**키워드 정확도 옵션**")
-    st.checkbox("키워드 엄격 필터링 (제목/설명/태그 검사)", value=True, key="kw_strict_on")
-    st.radio("매칭 방식", options=["하나 이상 포함(권장)", "모두 포함(엄격)"], index=0, horizontal=True, key="kw_strict_mode")
-
-    # Quota Estimator (대략)
-    st.subheader("🔢 쿼터 예상 소모량")
-    def _parse_for_estimator(txt: Optional[str]) -> List[str]:
-        return [p.strip() for part in (txt or "").split(",") for p in part.split() if p.strip()]
-    ch_list = _parse_for_estimator(st.session_state.get("channels_input", "")) if st.session_state["run_mode"] in ("채널", "둘다") else []
-    kw_list = st.session_state.get("effective_keywords", []) if st.session_state["run_mode"] in ("키워드", "둘다") else []
-    est_videos = len(ch_list) * st.session_state["per_channel_max"] + len(kw_list) * st.session_state["per_keyword_max"]
-    search_calls = len(ch_list) * math.ceil(st.session_state["per_channel_max"] / 50) + len(kw_list) * math.ceil(st.session_state["per_keyword_max"] / 50)
-    search_units = search_calls * 100
-    videos_calls = math.ceil(est_videos / 50) if est_videos else 0
-    videos_units = videos_calls * 1
-    chan_calls_min = math.ceil((len(ch_list) or 0) / 50) if est_videos else 0
-    chan_calls_max = math.ceil(est_videos / 50) if est_videos else 0
-    chan_units_min = chan_calls_min * 1
-    chan_units_max = chan_calls_max * 1
-    total_units_min = search_units + videos_units + chan_units_min
-    total_units_max = search_units + videos_units + chan_units_max
-    quota = DEFAULT_DAILY_QUOTA
-    warn = total_units_max > quota
-
-    cA, cB, cC, cD = st.columns(4)
-    cA.metric("search.list(100/u)", f"{search_units:,}", f"{search_calls} calls")
-    cB.metric("videos.list(1/u)", f"{videos_units:,}", f"{videos_calls} calls")
-    cC.metric("channels.list(1/u)", f"{chan_units_min:,} ~ {chan_units_max:,}", f"{chan_calls_min}~{chan_calls_max} calls")
-    cD.metric("총 예상(최소~최대)", f"{total_units_min:,} ~ {total_units_max:,}", f"일일 한도 {quota:,}")
-
-    if not warn:
-        st.success("대부분 한도 내에서 동작합니다.")
-    else:
-        st.error("최대 추정 사용량이 일일 한도를 초과할 수 있습니다. 검색 개수/키워드/채널 수를 조정하세요.")
-
-    col_run, col_clear = st.columns([0.25, 0.25])
-    run = col_run.button("시작하기", type="primary", key="run_btn")
-    clear = col_clear.button("결과 지우기", key="clear_btn")
-    if clear:
-        st.session_state["results_df"] = pd.DataFrame()
-        st.session_state["payload_cache"] = []
-        st.experimental_rerun()
-
-# ----------------------- Main run -----------------------
-if 'run' in locals() and run:
-    api_key = st.session_state.get("api_key", "")
-    if not api_key:
-        st.error("설정 탭에서 API 키를 입력하세요.")
-        st.stop()
-
-    run_mode = st.session_state["run_mode"]
-    form_factor = st.session_state["form_factor"]
-    shorts_sec = int(st.session_state["shorts_sec"])
-    days_back = int(st.session_state["days_back"])
-    per_channel_max = int(st.session_state["per_channel_max"])
-    per_keyword_max = int(st.session_state["per_keyword_max"])
-    min_vph = float(st.session_state["min_vph"])
-    wait_minutes = float(st.session_state["wait_minutes"])
-    ignore_filters = bool(st.session_state["ignore_filters"])
-    target_regions = st.session_state.get("target_regions", ["KR"])
-
-    strict_on = bool(st.session_state["kw_strict_on"])
-    strict_mode_val = st.session_state["kw_strict_mode"]
-    strict_mode_key = "all" if strict_mode_val == "모두 포함(엄격)" else "any"
-
-    base_keywords = st.session_state.get("effective_keywords", [])
-    effective_lang = st.session_state.get("effective_lang", "ko")
-
-    def _parse_inner(txt: Optional[str]) -> List[str]:
-        if not txt:
-            return []
-        return [p.strip() for part in txt.split(",") for p in part.split() if p.strip()]
-
-    input_channels = _parse_inner(st.session_state.get("channels_input", "")) if run_mode in ("채널", "둘다") else []
-
-    if len(input_channels) == 0 and len(base_keywords) == 0:
-        st.error("실행모드에 맞게 채널 또는 키워드를 최소 1개 이상 입력하세요.")
-        st.stop()
-
-    with st.spinner("검색 중…"):
-        published_after = (datetime.utcnow() - timedelta(days=days_back)).isoformat("T") + "Z"
-
-        def resolve_channel_ids(lst: List[str]) -> List[str]:
-            out: List[str] = []
-            for token in lst:
-                if token.startswith("@"):
-                    data = yt_get("search", {"part": "snippet", "type": "channel", "q": token, "maxResults": 1}, api_key, wait_minutes=wait_minutes)
-                    items = data.get("items", [])
-                    ch_id = items[0]["snippet"].get("channelId") if items else None
-                    if not ch_id and items:
-                        ch_id = items[0]["id"].get("channelId")
-                    if ch_id:
-                        out.append(ch_id)
-                else:
-                    out.append(token)
-            return out
-
-        channels = resolve_channel_ids(input_channels) if run_mode in ("채널", "둘다") else []
-        collected_ids = set()
-
-        # 채널 모드
-        if run_mode in ("채널", "둘다"):
-            for region in target_regions:
-                for ch in channels:
-                    ids = fetch_videos_by_search(
-                        api_key, channel_id=ch,
-                        region_code=region, relevance_language=effective_lang,
-                        published_after=published_after, max_results=per_channel_max,
-                        order="date", wait_minutes=wait_minutes
-                    )
-                    collected_ids.update(ids); time.sleep(0.02)
-
-        # 키워드 모드
-        if run_mode in ("키워드", "둘다"):
-            for region in target_regions:
-                for kw in base_keywords:
-                    if not kw:
-                        continue
-                    ids = fetch_videos_by_search(
-                        api_key, query=kw,
-                        region_code=region, relevance_language=effective_lang,
-                        published_after=published_after, max_results=per_keyword_max,
-                        order="viewCount", wait_minutes=wait_minutes
-                    )
-                    collected_ids.update(ids); time.sleep(0.02)
-
-        st.info(f"수집된 비디오 ID 수: {len(collected_ids)}")
-
-        details = fetch_video_details(api_key, list(collected_ids), wait_minutes=wait_minutes)
-        st.info(f"상세 조회된 비디오 수: {len(details)}")
-
-        channel_ids = {v["snippet"]["channelId"] for v in details.values() if "snippet" in v}
-        subs_map = fetch_channel_subs(api_key, list(channel_ids), wait_minutes=wait_minutes) if channel_ids else {}
-
-        # 엄격 필터용 키워드
-        all_keywords_norm = [normalize_text(k) for k in base_keywords]
-
-        rows: List[Dict[str, Any]] = []
-        for vid, detail in details.items():
-            snip = detail["snippet"]
-            metrics = compute_metrics(detail)
-            dur_sec = metrics["durationSec"]
-
-            if not ignore_filters:
-                if not filter_duration_mode(dur_sec, form_factor, shorts_sec=int(shorts_sec)):
-                    continue
-                if metrics["viewsPerHour"] < float(min_vph):
-                    continue
-
-            if strict_on and all_keywords_norm:
-                title = snip.get("title") or ""
-                desc = snip.get("description") or ""
-                tags = detail.get("snippet", {}).get("tags", [])
-                tag_text = " ".join(tags) if isinstance(tags, list) else ""
-                combined = f"{title}\n{desc}\n{tag_text}"
-                mode_key = "all" if strict_mode_key == "all" else "any"
-                if not contains_keywords(combined, all_keywords_norm, mode=mode_key):
-                    continue
-
-            ch_id = snip["channelId"]
-            subs = int(subs_map.get(ch_id, 0))
-            vs = (metrics["views"] / subs) if subs > 0 else None
-            thumb = (snip.get("thumbnails", {}).get("medium")
-                     or snip.get("thumbnails", {}).get("high")
-                     or snip.get("thumbnails", {}).get("default")
-                     or {}).get("url", "")
-            rows.append({
-                "Channel": snip["channelTitle"],
-                "Video Title": snip["title"],
-                "Uploaded": metrics["publishedAt"].astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
-                "_Uploaded_ts": metrics["publishedAt"].timestamp(),
-                "Views": metrics["views"],
-                "Views/hr": round(metrics["viewsPerHour"], 2),
-                "Subscribers": subs,
-                "Views/Subscribers": round(vs, 3) if vs is not None else None,
-                "Duration": human_duration(dur_sec),
-                "_Duration_sec": dur_sec,
-                "URL": f"https://www.youtube.com/watch?v={vid}",
-                "_vid": vid,
-                "_thumb": thumb or f"https://i.ytimg.com/vi/{vid}/mqdefault.jpg",
-            })
-
-        results_df = pd.DataFrame(rows, columns=[
-            "Channel", "Video Title", "Uploaded", "_Uploaded_ts", "Views", "Views/hr",
-            "Subscribers", "Views/Subscribers", "Duration", "_Duration_sec", "URL", "_vid", "_thumb"
-        ])
-        st.session_state["results_df"] = results_df
-        st.session_state["payload_cache"] = []  # 새 검색 시 캐시 무효화
-
-# ----------------------- Results tab -----------------------
-with tab_results:
-    st.subheader("결과")
-
-    # ▼ 새 옵션: 제목 한국어 번역 표시/툴팁
-    show_title_ko = st.checkbox("제목 아래 한국어 번역 표시", value=True, key="show_title_ko")
-    tooltip_title_ko = st.checkbox("제목에 마우스 오버 시 한국어 툴팁", value=True, key="tooltip_title_ko")
-
-    df = st.session_state.get("results_df", pd.DataFrame())
-    if df.empty:
-        st.info("아직 결과가 없습니다. 설정 탭에서 ‘시작하기’를 눌러 검색해 주세요.")
-    else:
-        st.success(f"{len(df)}개 결과")
-        df_sorted = df.sort_values(by=["Views/hr", "Views"], ascending=[False, False], kind="mergesort")
-
-        if st.session_state["payload_cache"]:
-            payload = st.session_state["payload_cache"]
-        else:
-            payload: List[Dict[str, Any]] = []
-            for _, r in df_sorted.iterrows():
-                # 필요할 때만 번역(캐시됨)
-                title_ko = translate_to_ko_once(r["Video Title"]) if (show_title_ko or tooltip_title_ko) else ""
-                payload.append({
-                    "channel": r["Channel"], "title": r["Video Title"], "title_ko": title_ko,
-                    "uploaded": r["Uploaded"], "uploaded_ts": float(r["_Uploaded_ts"]),
-                    "views": int(r["Views"]), "vph": float(r["Views/hr"]),
-                    "subs": int(r["Subscribers"]),
-                    "vs": (float(r["Views/Subscribers"]) if pd.notna(r["Views/Subscribers"]) else None),
-                    "duration": r["Duration"], "duration_sec": float(r["_Duration_sec"]),
-                    "url": r["URL"], "vid": r["_vid"], "thumb": r["_thumb"],
-                })
-            st.session_state["payload_cache"] = payload
-
-        html = build_component_html(st.session_state["payload_cache"],
-                                    show_ko=show_title_ko, tooltip_ko=tooltip_title_ko)
-        components.html(html, height=680, scrolling=False)
-
-        @st.cache_data
-        def to_excel(dfi: pd.DataFrame) -> bytes:
-            from io import BytesIO
-            try:
-                import openpyxl  # noqa: F401
-            except Exception:
-                bio = BytesIO(); bio.write(b"Install openpyxl: pip install openpyxl"); return bio.getvalue()
-            out = BytesIO()
-            export_df = dfi.drop(columns=["_Uploaded_ts", "_Duration_sec", "_vid", "_thumb"], errors="ignore")
-            with pd.ExcelWriter(out, engine="openpyxl") as writer:
-                export_df.to_excel(writer, index=False, sheet_name="HotVideos")
-            return out.getvalue()
-
-        xlsx = to_excel(df_sorted)
-        st.download_button("Download Excel", data=xlsx,
-                           file_name="youtube_hot_finder.xlsx",
-                           mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-
-        # Transcripts
-        st.markdown("### 📝 Transcripts 다운로드 (공개 자막이 있는 영상만)")
-        try:
-            from youtube_transcript_api import YouTubeTranscriptApi  # noqa: F401
-            transcripts_available = True
-        except Exception:
-            transcripts_available = False
-            st.info("Transcript 기능을 사용하려면 다음을 설치하세요:\n\n`pip install youtube-transcript-api`")
-
-        if transcripts_available:
-            titles_map = {
-                f"{row['Video Title']}  —  ({row['Channel']}) [{row['_vid']}]": row["_vid"]
-                for _, row in df_sorted.iterrows()
-            }
-            st.session_state.setdefault("transcript_selection", list(titles_map.keys())[:50])
-            select_keys = st.multiselect("대본을 받을 영상 선택", options=list(titles_map.keys()), key="transcript_selection")
-            lang_pref = st.text_input("우선 언어(예: ko, en, ko-KR)", value=st.session_state.get("lang_pref", "ko"), key="lang_pref")
-
-            col_srt, col_zip = st.columns([0.5, 0.5])
-            with col_srt:
-                st.write("**개별 SRT 다운로드**")
-                if select_keys:
-                    for label in select_keys[:30]:
-                        vid = titles_map[label]
-                        srt = fetch_transcript_srt(vid, lang_pref=lang_pref)
-                        if srt:
-                            fn = _safe_filename(label)[:100] + ".srt"
-                            st.download_button("⬇️ " + fn, data=srt.encode("utf-8"),
-                                               file_name=fn, mime="application/x-subrip", key=f"srt_{vid}")
-                        else:
-                            st.caption(f"• `{label}` : 공개 자막 없음 / 가져오기 실패")
-                else:
-                    st.caption("선택된 항목이 없습니다.")
-            with col_zip:
-                st.write("**선택 항목 ZIP 일괄 다운로드**")
-                if select_keys:
-                    labels_tuple = tuple(select_keys)
-                    vids_tuple = tuple(titles_map[k] for k in select_keys)
-                    zip_bytes = build_transcripts_zip_cached(vids_tuple, labels_tuple, lang_pref)
-                    st.download_button("⬇️ transcripts_selected.zip", data=zip_bytes,
-                                       file_name="transcripts_selected.zip", mime="application/zip",
-                                       key="zip_selected")
-                else:
-                    st.caption("선택된 항목이 없습니다.")
-
-st.markdown("---")
-st.caption("입력 탭에서 다국어 키워드를 미리보고, 설정 탭에서는 국가 범위만 고르면 됩니다. 제목·설명·태그 기반 엄격 필터도 유지됩니다.")
+# app.py — YouTube Hot Finder (simple globalized)
+# - 입력 탭: 원문 키워드 → 실시간 번역(예: ko→ja), "번역을 검색에 사용" 체크 시 번역본으로 검색
+# - 설정 탭: 국가 범위(한국만/해외만/한국+해외)만 선택 — 중복되는 언어/국가 입력 제거
+# - 결과 테이블: 헤더 정렬 + hover 미리보기 (JS, rerun 없음)
+# - 제목 한국어 번역: 제목 아래 한 줄/툴팁 옵션 추가 (캐시)
+# - 키워드 엄격 필터(제목/설명/태그), Excel, Transcript(SRT/ZIP), 쿼터 추적
+# - Windows 친화, pyarrow 미사용
+
+import os
+import re
+import time
+import json
+import math
+import threading
+import requests
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from collections import deque
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# orjson이 설치돼 있으면 페이로드 직렬화에 사용 (5-10배 빠름) — 없으면 stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# -----------------------------------------------------------------------------
+# Page config
+# -----------------------------------------------------------------------------
+st.set_page_config(page_title="YouTube Hot Finder", layout="wide")
+
+# -----------------------------------------------------------------------------
+# Constants / Config
+# -----------------------------------------------------------------------------
+API_BASE = "https://www.googleapis.com/youtube/v3"
+DEFAULT_DAILY_QUOTA = 10_000
+CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".youtube_hot_finder.json")
+
+LANG_NAME = {
+    "ko": "Korean", "en": "English", "ja": "Japanese", "zh": "Chinese",
+    "es": "Spanish", "de": "German", "fr": "French", "pt": "Portuguese"
+}
+FOREIGN_PRESET = ["US", "JP", "TW", "HK", "SG", "GB", "DE", "FR", "ES", "BR"]  # 해외 프리셋
+
+# -----------------------------------------------------------------------------
+# API key: 저장/불러오기 및 안전 로딩
+# -----------------------------------------------------------------------------
+def load_api_key_from_disk() -> Optional[str]:
+    try:
+        if os.path.exists(CONFIG_PATH):
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return str(data.get("api_key") or "").strip()
+    except Exception:
+        pass
+    return None
+
+def save_api_key_to_disk(key: str) -> bool:
+    try:
+        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+            json.dump({"api_key": key}, f)
+        return True
+    except Exception:
+        return False
+
+def delete_api_key_on_disk() -> bool:
+    try:
+        if os.path.exists(CONFIG_PATH):
+            os.remove(CONFIG_PATH)
+        return True
+    except Exception:
+        return False
+
+def _load_api_keys_safely() -> List[str]:
+    """환경변수 → secrets → 로컬 저장 순으로 다중/단일 키를 수집하고 중복 제거."""
+    keys: List[str] = []
+
+    # 1) 환경변수 (다중/단일)
+    env_multi = os.getenv("YOUTUBE_API_KEYS", "")
+    if env_multi.strip():
+        keys += [k.strip() for k in env_multi.split(",") if k.strip()]
+    env_single = os.getenv("YOUTUBE_API_KEY", "")
+    if env_single.strip():
+        keys.append(env_single.strip())
+
+    # 2) secrets.toml (없어도 예외 안터지게 보호)
+    try:
+        sec = st.secrets
+        if "YOUTUBE_API_KEYS" in sec:
+            v = sec["YOUTUBE_API_KEYS"]
+            if isinstance(v, (list, tuple)):
+                keys += [str(x).strip() for x in v if str(x).strip()]
+            else:
+                keys += [x.strip() for x in str(v).split(",") if x.strip()]
+        if "YOUTUBE_API_KEY" in sec:
+            keys.append(str(sec["YOUTUBE_API_KEY"]).strip())
+    except Exception:
+        pass
+
+    # 3) 로컬 저장
+    if not keys:
+        dk = load_api_key_from_disk()
+        if dk:
+            keys = [dk]
+
+    # 중복 제거(순서 유지)
+    seen, uniq = set(), []
+    for k in keys:
+        if k and k not in seen:
+            seen.add(k); uniq.append(k)
+    return uniq
+
+# 최초 세션 세팅
+if "api_keys" not in st.session_state:
+    _keys = _load_api_keys_safely()
+    st.session_state["api_keys"] = _keys
+    st.session_state["api_key_idx"] = 0
+    st.session_state["api_key"] = (_keys[0] if _keys else (load_api_key_from_disk() or ""))
+
+# -----------------------------------------------------------------------------
+# Session defaults
+# -----------------------------------------------------------------------------
+st.session_state.setdefault("q_calls", {"search": 0, "videos": 0, "channels": 0})
+st.session_state.setdefault("q_units", 0)
+st.session_state.setdefault("q_log", [])
+st.session_state.setdefault("api_waiting", False)
+st.session_state.setdefault("api_wait_reason", "")
+# 결과의 원본 상태는 list-of-dicts — DataFrame은 Excel 내보내기 때만 생성
+st.session_state.setdefault("rows_state", [])
+st.session_state.setdefault("lang_pref", "ko")
+
+if "api_key" not in st.session_state:
+    st.session_state["api_key"] = load_api_key_from_disk() or ""
+
+def _quota_units_for(endpoint_name: str) -> int:
+    if endpoint_name.startswith("search"): return 100
+    if endpoint_name.startswith("videos"): return 1
+    if endpoint_name.startswith("channels"): return 1
+    return 0
+
+# 워커 스레드에서도 쿼터 집계가 섞이지 않도록 보호
+_QUOTA_LOCK = threading.Lock()
+
+def _record_quota(endpoint_name: str, path: str) -> None:
+    units = _quota_units_for(endpoint_name)
+    with _QUOTA_LOCK:
+        if endpoint_name.startswith("search"):
+            st.session_state["q_calls"]["search"] += 1
+        elif endpoint_name.startswith("videos"):
+            st.session_state["q_calls"]["videos"] += 1
+        elif endpoint_name.startswith("channels"):
+            st.session_state["q_calls"]["channels"] += 1
+        st.session_state["q_units"] += units
+        st.session_state["q_log"].append((endpoint_name, units, path, time.time()))
+
+# -----------------------------------------------------------------------------
+# Translator (cached with fallback)
+# -----------------------------------------------------------------------------
+# googletrans Translator — 매 호출 재생성하지 않고 최초 사용 시 1회만 만든다
+_GT_TRANSLATOR = None
+
+def _get_gt_translator():
+    global _GT_TRANSLATOR
+    if _GT_TRANSLATOR is None:
+        try:
+            from googletrans import Translator
+            _GT_TRANSLATOR = Translator()
+        except Exception:
+            _GT_TRANSLATOR = False  # import 실패 기억 — 재시도 안 함
+    return _GT_TRANSLATOR or None
+
+@lru_cache(maxsize=10_000)
+def _translate_inner(text: str, src_lang: str, tgt_lang: str) -> str:
+    """프로세스 로컬 번역 캐시 — Streamlit 캐시가 비워져도 반복 번역은 O(1)."""
+    # 1) googletrans
+    try:
+        gt = _get_gt_translator()
+        if gt is not None:
+            return gt.translate(text, src=src_lang, dest=tgt_lang).text
+    except Exception:
+        pass
+    # 2) deep-translator
+    try:
+        return _get_dt_google()(source=src_lang, target=tgt_lang).translate(text)
+    except Exception:
+        return text  # 실패 시 원문
+
+@st.cache_data(show_spinner=False)
+def translate_keyword_once(src_text: str, src_lang: str, tgt_lang: str) -> str:
+    s = (src_text or "").strip()
+    if not s or src_lang == tgt_lang:
+        return s
+    return _translate_inner(s, src_lang, tgt_lang)
+
+# deep-translator 클래스 — 최초 사용 시 1회만 import
+_DT_GOOGLE = None
+
+def _get_dt_google():
+    global _DT_GOOGLE
+    if _DT_GOOGLE is None:
+        from deep_translator import GoogleTranslator
+        _DT_GOOGLE = GoogleTranslator
+    return _DT_GOOGLE
+
+def translate_keywords_list(keywords: List[str], src_lang: str, tgt_lang: str) -> List[str]:
+    # 키워드별 캐시(translate_keyword_once)를 그대로 탄다 — 목록에서 한 글자만
+    # 바뀌어도 수정된 키워드만 캐시를 빗나가고 나머지는 번역 호출이 없다
+    outs: List[str] = []
+    seen = set()
+    for k in keywords:
+        k = (k or "").strip()
+        if not k:
+            continue
+        v = translate_keyword_once(k, src_lang, tgt_lang).strip() or k
+        if v.lower() not in seen:
+            seen.add(v.lower()); outs.append(v)
+    return outs
+
+# ▼ 제목 한국어 번역(캐시) — googletrans → deep-translator 순서로 시도, 실패 시 원문 반환
+@st.cache_data(show_spinner=False)
+def translate_to_ko_once(text: str) -> str:
+    s = (text or "").strip()
+    if not s:
+        return s
+    try:
+        gt = _get_gt_translator()
+        if gt is not None:
+            return gt.translate(s, dest="ko").text
+    except Exception:
+        pass
+    try:
+        return _get_dt_google()(source="auto", target="ko").translate(s)
+    except Exception:
+        return s
+
+# -----------------------------------------------------------------------------
+# YouTube API helpers (쿼터 초과 시 자동 로테이션)
+# -----------------------------------------------------------------------------
+# 동시 API 호출 상한 — YouTube rate limit 보호
+_MAX_CONCURRENCY = 8
+_API_SEM = threading.BoundedSemaphore(_MAX_CONCURRENCY)
+
+class _RateLimiter:
+    """초당 요청 수를 선제적으로 제한하는 토큰 버킷 (스레드 안전).
+
+    429를 맞은 뒤 대기하는 사후 대응 대신, 애초에 QPS 한도 아래로만
+    송신해 낭비되는 왕복 자체를 없앤다.
+    """
+    def __init__(self, max_rate: int, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._lock = threading.Lock()
+        self._stamps: deque = deque()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self.time_period:
+                    self._stamps.popleft()
+                if len(self._stamps) < self.max_rate:
+                    self._stamps.append(now)
+                    return
+                wait = self.time_period - (now - self._stamps[0])
+            time.sleep(max(wait, 0.001))
+
+# YouTube API 전역 QPS 상한 (키당 per-second 쿼터 보호)
+_LIMITER = _RateLimiter(max_rate=10, time_period=1.0)
+
+def _run_parallel(fn: Callable[[Any], Any], items: Iterable[Any],
+                  max_workers: int = _MAX_CONCURRENCY) -> List[Any]:
+    """I/O 바운드 작업을 스레드 풀로 병렬 실행 (입력 순서 유지).
+
+    워커 스레드에 Streamlit 스크립트 컨텍스트를 전파해 session_state 접근이
+    메인 스레드와 동일하게 동작하도록 한다.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(x) for x in items]
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+
+    def _call(x):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(x)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        return list(ex.map(_call, items))
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """커넥션 풀 + 자동 재시도가 장착된 공용 Session (rerun 간 재사용).
+
+    매 호출마다 TCP+TLS 핸드셰이크를 새로 하지 않도록 keep-alive 커넥션을
+    재사용한다. st.cache_resource라 스크립트 재실행에도 하나만 유지된다.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    s = requests.Session()
+    # gzip 응답 명시 — YouTube API는 압축을 지원하고 JSON 응답이 꽤 크다
+    s.headers.update({"Accept-Encoding": "gzip"})
+    # 429는 여기서 재시도하지 않는다 — 쿼터 초과는 yt_get의 키 로테이션이 처리
+    adapter = HTTPAdapter(
+        pool_connections=16, pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[500, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+def yt_get(endpoint: str, params: Dict[str, Any], api_key: str,
+           wait_minutes: float = 0.0, max_retries: int = 2) -> Dict[str, Any]:
+    # 항상 현재 회전키 우선
+    params = {**params, "key": st.session_state.get("api_key", api_key)}
+
+    tries = 0
+    rotations = 0  # 이 호출에서 수행한 키 로테이션 수 — 한 바퀴를 다 돌면 backoff로
+    while True:
+        _LIMITER.acquire()
+        with _API_SEM:
+            r = _http_session().get(f"{API_BASE}/{endpoint}", params=params, timeout=30)
+        if r.status_code == 200:
+            _record_quota(endpoint, r.url)
+            return r.json()
+
+        # 에러 이유 추출(가능하면)
+        try:
+            body = r.json()
+            err_reason = (
+                (body.get("error", {}).get("errors", [{}])[0].get("reason"))
+                or body.get("error", {}).get("message", "")
+                or r.text
+            )
+        except Exception:
+            err_reason = r.text
+
+        err_l = str(err_reason).lower()
+        qwords = ("quota", "daily", "rate", "exceed")  # quotaExceeded 등 포괄
+        is_quota = (r.status_code in (403, 429) and any(k in err_l for k in qwords))
+        # 일일 쿼터 소진과 순간적인 rate 제한을 구분 — 후자는 키를 '소진'으로 남기지 않는다
+        is_daily = ("quota" in err_l) or ("daily" in err_l)
+
+        if is_quota:
+            # 1) 소진되지 않은 다음 키로 즉시 로테이션 — 키가 남아있는 한 대기하지 않는다
+            keys = st.session_state.get("api_keys", [])
+            exhausted = st.session_state.setdefault("quota_exhausted_idx", set())
+            next_idx = None
+            with _QUOTA_LOCK:
+                cur = st.session_state.get("api_key_idx", 0)
+                if is_daily:
+                    exhausted.add(cur)
+                n = len(keys)
+                # 키 목록을 이미 한 바퀴 돌았다면 더 로테이션하지 않는다 — 지속되는
+                # rate 에러에서 키들이 끝없이 핑퐁하며 API를 두드리는 것을 막는다
+                if n and rotations < n - 1:
+                    next_idx = next((j % n for j in range(cur + 1, cur + 1 + n)
+                                     if j % n not in exhausted and j % n != cur), None)
+                if next_idx is not None:
+                    st.session_state["api_key_idx"] = next_idx
+                    st.session_state["api_key"] = keys[next_idx]
+            if next_idx is not None:
+                rotations += 1
+                params["key"] = keys[next_idx]
+                continue  # 새 키로 즉시 재시도
+
+            # 2) 로테이션할 키가 없을 때 — 재시도 예산 소진
+            tries += 1
+
+            # 순간 rate 제한이면 긴 쿼터 대기 대신 짧은 backoff 후 재시도
+            # (backoff마다 로테이션 예산도 새로 — 재시도 횟수는 tries가 묶는다)
+            if not is_daily and tries <= max_retries:
+                time.sleep(2 * tries)
+                rotations = 0
+                continue
+
+            # 모든 키 일일 쿼터 소진 → (옵션) 대기 후 재시도 (키 로테이션은 재시도 횟수에 안 센다)
+            if wait_minutes > 0 and tries <= max_retries:
+                st.session_state["api_waiting"] = True
+                st.session_state["api_wait_reason"] = f"{endpoint}: {err_reason}"
+                wait_secs = int(wait_minutes * 60)
+                with st.status("API 쿼터 초과로 대기 중…", expanded=True) as stat:
+                    # 1초마다 위젯을 다시 그리지 않고 10초 단위로만 갱신 (렌더 횟수 ~60배 절감)
+                    deadline = time.monotonic() + wait_secs
+                    stat.update(label=f"API 대기 ~{wait_secs}초 (사유: {err_reason})")
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        time.sleep(min(10, remaining))
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            stat.update(label=f"API 대기 {int(remaining)}초 남음 (사유: {err_reason})")
+                st.session_state["api_waiting"] = False
+                exhausted.clear()  # 대기 후 모든 키를 다시 시도 대상에 포함
+                rotations = 0
+                params["key"] = st.session_state.get("api_key", api_key)
+                continue  # while 루프 재시도
+
+        # 다른 에러거나 재시도 불가면 즉시 예외
+        raise RuntimeError(f"YouTube API error {r.status_code}: {r.text}")
+
+@st.cache_data(ttl=600, max_entries=512, show_spinner=False)
+def _yt_get_cached(endpoint: str, params_items: Tuple[Tuple[str, Any], ...],
+                   _api_key: str, _wait_minutes: float) -> Dict[str, Any]:
+    # 키는 endpoint+params 만 — _api_key/_wait_minutes 는 캐시 키에서 제외
+    return yt_get(endpoint, dict(params_items), _api_key, wait_minutes=_wait_minutes)
+
+def yt_get_cached(endpoint: str, params: Dict[str, Any], api_key: str,
+                  wait_minutes: float = 0.0) -> Dict[str, Any]:
+    """동일한 요청의 rerun 재호출을 쿼터 소모 없이 캐시로 처리 (TTL 10분)."""
+    return _yt_get_cached(endpoint, tuple(sorted(params.items())), api_key, wait_minutes)
+
+# ISO-8601 영상 길이 패턴 — 모듈 로드 시 1회만 컴파일
+_DUR_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+def batched(iterable: Iterable[Any], n: int):
+    # islice가 C 레벨에서 n개씩 끊는다 — 원소별 파이썬 루프 제거
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, n))
+        if not batch:
+            return
+        yield batch
+
+def fetch_videos_by_search(
+    api_key: str, query: Optional[str] = None, channel_id: Optional[str] = None,
+    region_code: Optional[str] = None, relevance_language: Optional[str] = None,
+    published_after: Optional[str] = None, max_results: int = 100,
+    order: str = "viewCount", wait_minutes: float = 0.0
+) -> List[str]:
+    effective_order = "date" if (published_after and order != "date") else order
+    ids: List[str] = []
+    params = {"part": "snippet", "type": "video", "maxResults": 50, "order": effective_order}
+    if query: params["q"] = query
+    if channel_id: params["channelId"] = channel_id
+    if region_code: params["regionCode"] = region_code
+    if relevance_language: params["relevanceLanguage"] = relevance_language
+    if published_after: params["publishedAfter"] = published_after
+
+    while True:
+        data = yt_get_cached("search", params, api_key, wait_minutes=wait_minutes)
+        for item in data.get("items", []):
+            ids.append(item["id"]["videoId"])
+            if len(ids) >= max_results:
+                return ids
+        next_page = data.get("nextPageToken")
+        if not next_page:
+            break
+        params["pageToken"] = next_page  # 페이지 토큰만이 유일하게 변하는 슬롯
+    return ids
+
+_DETAIL_TTL = 1800  # 영상 상세는 거의 불변 — 30분 캐시
+
+def fetch_video_details(api_key: str, video_ids: List[str], wait_minutes: float = 0.0) -> Dict[str, Any]:
+    details: Dict[str, Any] = {}
+    if not video_ids:
+        return details
+    # 중복 ID 방지(순서 유지) — 같은 ID를 두 번 요청해 쿼터를 낭비하지 않는다
+    video_ids = list(dict.fromkeys(video_ids))
+    # 비디오 ID 단위 캐시 — 이미 본 ID는 API를 다시 때리지 않는다
+    cache = st.session_state.setdefault("detail_cache", {})
+    now = time.time()
+    missing: List[str] = []
+    for vid in video_ids:
+        hit = cache.get(vid)
+        if hit and now - hit[0] < _DETAIL_TTL:
+            details[vid] = hit[1]
+        else:
+            missing.append(vid)
+    if not missing:
+        return details
+    # 50개 배치들을 병렬로 요청 — 네트워크 왕복을 겹쳐 지연시간을 줄인다
+    def _one(batch: List[str]) -> Dict[str, Any]:
+        return yt_get("videos", {"part": "snippet,contentDetails,statistics", "id": ",".join(batch)}, api_key, wait_minutes=wait_minutes)
+    for data in _run_parallel(_one, batched(missing, 50)):
+        for item in data.get("items", []):
+            cache[item["id"]] = (now, item)
+            details[item["id"]] = item
+    return details
+
+def fetch_channel_subs(api_key: str, channel_ids: List[str], wait_minutes: float = 0.0) -> Dict[str, int]:
+    subs: Dict[str, int] = {}
+    if not channel_ids:
+        return subs
+    channel_ids = list(dict.fromkeys(channel_ids))
+    def _one(batch: List[str]) -> Dict[str, Any]:
+        return yt_get("channels", {"part": "statistics", "id": ",".join(batch)}, api_key, wait_minutes=wait_minutes)
+    for data in _run_parallel(_one, batched(channel_ids, 50)):
+        for item in data.get("items", []):
+            subs[item["id"]] = int(item["statistics"].get("subscriberCount", 0))
+    return subs
+
+# rerun 간 상위 수준 결과 재사용 — 캐시 키는 논리 인자뿐, _api_key/_wait_minutes 는 해시 제외
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(query: Optional[str], channel_id: Optional[str], region_code: Optional[str],
+                   relevance_language: Optional[str], published_after: Optional[str],
+                   max_results: int, order: str,
+                   _api_key: str, _wait_minutes: float) -> List[str]:
+    return fetch_videos_by_search(
+        _api_key, query=query, channel_id=channel_id, region_code=region_code,
+        relevance_language=relevance_language, published_after=published_after,
+        max_results=max_results, order=order, wait_minutes=_wait_minutes)
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def _cached_video_details(video_ids: Tuple[str, ...], _api_key: str, _wait_minutes: float) -> Dict[str, Any]:
+    return fetch_video_details(_api_key, list(video_ids), wait_minutes=_wait_minutes)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_channel_subs(channel_ids: Tuple[str, ...], _api_key: str, _wait_minutes: float) -> Dict[str, int]:
+    return fetch_channel_subs(_api_key, list(channel_ids), wait_minutes=_wait_minutes)
+
+def compute_metrics_frame(details: Dict[str, Any]) -> pd.DataFrame:
+    """전체 영상의 지표를 한 번의 벡터 연산으로 계산.
+
+    per-video 파이썬 루프(datetime 파싱 + 정규식 매칭 반복)를 pandas의
+    C 레벨 연산으로 대체한다. 인덱스는 비디오 ID.
+    """
+    if not details:
+        return pd.DataFrame(columns=["publishedAt", "views", "viewsPerHour", "durationSec"])
+    df = pd.DataFrame({
+        "publishedAt": [d["snippet"]["publishedAt"] for d in details.values()],
+        "views": [int(d.get("statistics", {}).get("viewCount", 0)) for d in details.values()],
+        "duration": [d.get("contentDetails", {}).get("duration", "PT0S") for d in details.values()],
+    }, index=list(details.keys()))
+    df["publishedAt"] = pd.to_datetime(df["publishedAt"], utc=True)
+    hours = (pd.Timestamp.now(tz="UTC") - df["publishedAt"]).dt.total_seconds() / 3600.0
+    df["viewsPerHour"] = df["views"].astype("int64") / hours.clip(lower=1e-6)
+    hms = df["duration"].str.extract(_DUR_RE).fillna(0).astype("int64")
+    df["durationSec"] = hms[0] * 3600 + hms[1] * 60 + hms[2]
+    return df.drop(columns=["duration"])
+
+def human_duration(seconds: int) -> str:
+    h = seconds // 3600; m = (seconds % 3600) // 60; s = seconds % 60
+    if h:
+        return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
+    return f"{int(m):02d}:{int(s):02d}"
+
+# 쉼표/공백 구분 토크나이저 — 입력 탭 rerun마다 돌기 때문에 정규식 1회 스캔으로 처리
+_TOKEN_RE = re.compile(r'[^,\s]+')
+
+def parse_list_field(txt: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(txt) if txt else []
+
+# -----------------------------------------------------------------------------
+# 키워드 엄격 필터
+# -----------------------------------------------------------------------------
+def normalize_text(s: str) -> str:
+    return (s or "").lower()
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]):
+    """'any' 모드용 키워드 알터네이션 — 같은 키워드 집합은 1회만 컴파일."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+def build_keyword_mask(series: pd.Series, keywords: List[str], mode: str) -> pd.Series:
+    """소문자 텍스트 Series에 대한 키워드 매칭 마스크 (행별 파이썬 루프 없이 계산).
+
+    "any"는 키워드들을 하나의 정규식으로 합쳐 한 번의 C 레벨 스캔으로,
+    "all"은 키워드별 contains 를 논리곱으로 연결해 처리한다.
+    """
+    ks = [normalize_text(k) for k in keywords if k.strip()]
+    if not ks:
+        return pd.Series(True, index=series.index)
+    if mode == "all":
+        mask = pd.Series(True, index=series.index)
+        for k in ks:
+            mask &= series.str.contains(k, regex=False, na=False)
+        return mask
+    return series.str.contains(_keyword_pattern(tuple(ks)), regex=True, na=False)
+
+def _combined_text(detail: Dict[str, Any]) -> str:
+    """엄격 필터 대상 텍스트(제목+설명+태그)를 비디오당 1회 조립."""
+    s = detail.get("snippet", {})
+    tags = s.get("tags", [])
+    tag_text = " ".join(tags) if isinstance(tags, list) else ""
+    return f"{s.get('title') or ''}\n{s.get('description') or ''}\n{tag_text}"
+
+def filter_details_frame(details: Dict[str, Any], *,
+                         form_factor: str, shorts_sec: int, min_vph: float,
+                         ignore_filters: bool, strict_keywords: List[str],
+                         strict_mode: str) -> pd.DataFrame:
+    """상세 응답을 열 단위(SoA) 프레임으로 펼치고 필터 마스크까지 적용.
+
+    구독자 조회 전에 생존 채널을 먼저 알 수 있도록 행 조립(assemble_rows)과
+    분리되어 있다. per-video 파이썬 루프 대신 불리언 마스크 하나로 거른다.
+    """
+    if not details:
+        return pd.DataFrame()
+    df = compute_metrics_frame(details)
+    snips = [d["snippet"] for d in details.values()]
+    df["Channel"] = [s["channelTitle"] for s in snips]
+    df["Video Title"] = [s["title"] for s in snips]
+    df["_ch"] = [s["channelId"] for s in snips]
+    df["_thumb"] = [
+        (s.get("thumbnails", {}).get("medium")
+         or s.get("thumbnails", {}).get("high")
+         or s.get("thumbnails", {}).get("default")
+         or {}).get("url", "")
+        for s in snips
+    ]
+
+    # "전체 보기"(필터 무시 + 엄격필터 꺼짐)면 마스크 계산·재색인 자체를 건너뛴다
+    if not ignore_filters or strict_keywords:
+        # 필터는 행별 분기 대신 마스크 하나로
+        mask = pd.Series(True, index=df.index)
+        if not ignore_filters:
+            if form_factor == "쇼츠":
+                mask &= df["durationSec"] < shorts_sec
+            elif form_factor == "롱폼":
+                mask &= df["durationSec"] >= shorts_sec
+            mask &= df["viewsPerHour"] >= min_vph
+        if strict_keywords:
+            text = pd.Series({v: _combined_text(d) for v, d in details.items()}, dtype="object").str.lower()
+            mask &= build_keyword_mask(text, strict_keywords, strict_mode)
+        df = df[mask]
+    return df
+
+def assemble_rows(df: pd.DataFrame, subs_map: Dict[str, int]) -> List[Dict[str, Any]]:
+    """필터를 통과한 프레임을 기존 포맷의 행 dict 목록으로 조립 (벡터 연산)."""
+    if df.empty:
+        return []
+    views = df["views"].to_numpy(dtype="int64")
+    subs = df["_ch"].map(lambda c: int(subs_map.get(c, 0))).to_numpy(dtype="int64")
+    vs = np.full(len(views), np.nan)
+    np.divide(views, subs, out=vs, where=subs > 0)
+    published = pd.DatetimeIndex(df["publishedAt"])
+    dur_sec = df["durationSec"].to_numpy(dtype="int64")
+    vids = df.index.to_numpy()
+    rows_df = pd.DataFrame({
+        "Channel": df["Channel"].to_numpy(),
+        "Video Title": df["Video Title"].to_numpy(),
+        "Uploaded": published.strftime("%Y-%m-%d %H:%M UTC"),  # C 레벨 일괄 포맷
+        "_Uploaded_ts": published.asi8 / 1e9,
+        "Views": views,
+        "Views/hr": np.round(df["viewsPerHour"].to_numpy(), 2),
+        "Subscribers": subs,
+        "Views/Subscribers": np.round(vs, 3),
+        "Duration": [human_duration(int(s)) for s in dur_sec],
+        "_Duration_sec": dur_sec,
+        # URL은 _vid에서 파생 가능 — 행 상태/캐시를 불리지 않도록 사용처에서 조립
+        "_vid": vids,
+        "_thumb": np.where(df["_thumb"].to_numpy() != "", df["_thumb"].to_numpy(),
+                           [f"https://i.ytimg.com/vi/{v}/mqdefault.jpg" for v in vids]),
+    })
+    rows = rows_df.to_dict("records")
+    for r in rows:  # NaN → None (구독자 0명 채널, JSON/정렬 호환)
+        if pd.isna(r["Views/Subscribers"]):
+            r["Views/Subscribers"] = None
+    return rows
+
+def sort_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Views/hr ↓, Views ↓ 정렬 — 행별 파이썬 튜플 키 대신 numpy lexsort 1회."""
+    if len(rows) < 2:
+        return list(rows)
+    vph = np.array([r["Views/hr"] for r in rows], dtype="float64")
+    views = np.array([r["Views"] for r in rows], dtype="int64")
+    idx = np.lexsort((-views, -vph))  # lexsort는 마지막 키가 1차 정렬 키
+    return [rows[i] for i in idx]
+
+# -----------------------------------------------------------------------------
+# HTML/JS component (table + preview) — 한국어 번역 표시/툴팁 옵션 통합
+# -----------------------------------------------------------------------------
+_COMPONENT_TPL = r"""
+<div id="app-root"></div>
+<script type="application/json" id="data">__DATA__</script>
+<style>
+:root { --bg:#fff; --fg:#0f172a; --muted:#475569; --border:#e5e7eb; --thead-bg:#f3f4f6; --thead-fg:#0f172a; --row-hover:#f8fafc; }
+@media (prefers-color-scheme: dark){ :root{ --bg:#0b1020; --fg:#f8fafc; --muted:#cbd5e1; --border:#334155; --thead-bg:#1f2937; --thead-fg:#f8fafc; --row-hover:#111827; } }
+html,body{background:transparent;color:var(--fg);font-family:ui-sans-serif,system-ui,-apple-system,Segoe UI,Roboto,Helvetica,Arial;}
+.container{display:grid;grid-template-columns:85% 15%;gap:12px;height:640px;}
+.table-wrap{border:1px solid var(--border);border-radius:10px;overflow:hidden;display:flex;flex-direction:column;min-width:0;}
+.table-head{background:var(--thead-bg);color:var(--thead-fg);padding:6px 10px;font-weight:700;border-bottom:1px solid var(--border);font-size:13px;}
+.table-scroll{overflow:auto;height:100%;}
+table{width:100%;border-collapse:collapse;table-layout:fixed;}
+th,td{border-bottom:1px solid var(--border);padding:6px 8px;font-size:12px;text-align:left;}
+th{position:sticky;top:0;background:var(--thead-bg);color:var(--thead-fg);z-index:2;cursor:pointer;user-select:none;}
+tr:hover td{background:var(--row-hover);}
+th .caret{opacity:.6;margin-left:4px;}
+colgroup col.title{width:24%;} colgroup col.channel{width:14%;} colgroup col.uploaded{width:13%;}
+colgroup col.views{width:10%;} colgroup col.vph{width:10%;} colgroup col.subs{width:10%;}
+colgroup col.vs{width:9%;} colgroup col.dur{width:10%;}
+td.title,th.title{white-space:normal;word-break:break-word;line-height:1.25;font-size:11.5px;}
+td.title .title-ko{display:block;color:var(--muted);font-size:11px;margin-top:2px;} /* 번역 줄 */
+td:not(.title),th:not(.title){white-space:nowrap;}
+.preview{border:1px solid var(--border);border-radius:10px;padding:8px;}
+.preview .img-wrap{display:flex;justify-content:center;}
+.preview img{width:100%;max-width:200px;height:auto;border-radius:6px;border:1px solid var(--border);display:block;}
+.meta{font-size:11px;color:var(--muted);}
+.title-pv{font-weight:700;margin:6px 0 4px 0;font-size:12px;}
+.link a{color:inherit;text-decoration:underline;font-size:12px;}
+.badge{display:inline-block;padding:1px 5px;border:1px solid var(--border);border-radius:6px;font-size:11px;margin-right:4px;}
+</style>
+<script>
+(function(){
+  const root = document.getElementById('app-root');
+  const data = JSON.parse(document.getElementById('data').textContent || "[]");
+
+  // ▼ 파이썬에서 내려준 옵션
+  const SHOW_KO = __SHOW_KO__;
+  const TOOLTIP_KO = __TOOLTIP_KO__;
+
+  const columns = [
+    {key:'title',label:'Video Title',type:'str',className:'title'},
+    {key:'channel',label:'Channel',type:'str',className:'channel'},
+    {key:'uploaded',label:'Uploaded',type:'time',sortKey:'uploaded_ts',className:'uploaded'},
+    {key:'views',label:'Views',type:'num',className:'views'},
+    {key:'vph',label:'Views/hr',type:'num',className:'vph'},
+    {key:'subs',label:'Subscribers',type:'num',className:'subs'},
+    {key:'vs',label:'Views/Subscribers',type:'num',className:'vs'},
+    {key:'duration',label:'Duration',type:'dur',sortKey:'duration_sec',className:'dur'},
+  ];
+  const fmtInt = (n)=> (n==null||isNaN(n))? '' : Number(n).toLocaleString();
+  const fmtNum = (n)=> (n==null||isNaN(n))? '' : (Math.round(n*100)/100).toLocaleString();
+
+  let sortKey='vph', sortDir=-1, rows=data.slice();
+  function sortRows(){
+    rows.sort((a,b)=>{
+      const col = columns.find(c=>c.key===sortKey)||{};
+      const key = col.sortKey||col.key||sortKey;
+      let av=a[key]; let bv=b[key];
+      if(av==null) av=-Infinity; if(bv==null) bv=-Infinity;
+      if(typeof av==='string' && typeof bv==='string'){ return sortDir * av.localeCompare(bv); }
+      return sortDir * ((+av)-(+bv));
+    });
+  }
+  sortRows();
+
+  const container=document.createElement('div'); container.className='container';
+  const tableWrap=document.createElement('div'); tableWrap.className='table-wrap';
+  const head=document.createElement('div'); head.className='table-head'; head.textContent='Hot Videos';
+  const scroll=document.createElement('div'); scroll.className='table-scroll';
+  const table=document.createElement('table');
+
+  const colg=document.createElement('colgroup');
+  ['title','channel','uploaded','views','vph','subs','vs','dur'].forEach(c=>{const col=document.createElement('col'); col.className=c; colg.appendChild(col);});
+  table.appendChild(colg);
+
+  const thead=document.createElement('thead'); const trh=document.createElement('tr');
+  columns.forEach(col=>{
+    const th=document.createElement('th'); th.className=col.className||''; th.textContent=col.label;
+    const caret=document.createElement('span'); caret.className='caret'; caret.textContent=(sortKey===col.key?(sortDir===-1?'▼':'▲'):''); th.appendChild(caret);
+    th.addEventListener('click',()=>{ if(sortKey===col.key){sortDir*=-1;} else {sortKey=col.key; sortDir=-1;}
+      [...thead.querySelectorAll('th .caret')].forEach(c=>c.textContent=''); caret.textContent=(sortDir===-1?'▼':'▲'); sortRows(); renderBody();});
+    trh.appendChild(th);
+  });
+  thead.appendChild(trh); table.appendChild(thead);
+  const tbody=document.createElement('tbody'); table.appendChild(tbody); scroll.appendChild(table);
+  tableWrap.appendChild(head); tableWrap.appendChild(scroll);
+
+  const preview=document.createElement('div'); preview.className='preview';
+  const imgWrap=document.createElement('div'); imgWrap.className='img-wrap';
+  const pvImg=document.createElement('img'); imgWrap.appendChild(pvImg);
+  const pvTitle=document.createElement('div'); pvTitle.className='title-pv';
+  const pvMeta=document.createElement('div'); pvMeta.className='meta';
+  const pvBadges=document.createElement('div');
+  const pvLink=document.createElement('div'); pvLink.className='link';
+  preview.appendChild(imgWrap); preview.appendChild(pvTitle); preview.appendChild(pvMeta); preview.appendChild(pvBadges); preview.appendChild(pvLink);
+
+  container.appendChild(tableWrap); container.appendChild(preview); root.appendChild(container);
+
+  function escapeHtml(s){ return (s==null?'':String(s)).replace(/[&<>"']/g,m=>({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'}[m])); }
+
+  function rowHTML(r){
+    // 제목 본문 + 번역 줄 구성
+    let titleInner = escapeHtml(r.title);
+    if (SHOW_KO && r.title_ko && r.title_ko !== r.title){
+      titleInner += '<span class="title-ko">'+escapeHtml(r.title_ko)+'</span>';
+    }
+    const titleAttr = TOOLTIP_KO && r.title_ko ? r.title_ko : r.title;
+
+    return '<tr data-vid="'+r.vid+'">'
+      + '<td class="title" title="'+escapeHtml(titleAttr)+'">'+titleInner+'</td>'
+      + '<td class="channel" title="'+escapeHtml(r.channel)+'">'+escapeHtml(r.channel)+'</td>'
+      + '<td class="uploaded" data-sort="'+r.uploaded_ts+'">'+escapeHtml(r.uploaded)+'</td>'
+      + '<td class="views" data-sort="'+r.views+'">'+fmtInt(r.views)+'</td>'
+      + '<td class="vph" data-sort="'+r.vph+'">'+fmtNum(r.vph)+'</td>'
+      + '<td class="subs" data-sort="'+r.subs+'">'+fmtInt(r.subs)+'</td>'
+      + '<td class="vs" data-sort="'+(r.vs==null?'':r.vs)+'">'+(r.vs==null?'':r.vs)+'</td>'
+      + '<td class="dur" data-sort="'+r.duration_sec+'">'+escapeHtml(r.duration)+'</td>'
+      + '</tr>';
+  }
+
+  function renderBody(){
+    tbody.innerHTML = rows.map(rowHTML).join('');
+    Array.prototype.forEach.call(tbody.querySelectorAll('tr'), function(tr){
+      tr.addEventListener('mouseenter', function(){
+        const vid=tr.getAttribute('data-vid'); const r=rows.find(x=>x.vid===vid); if(!r) return;
+        pvImg.src=r.thumb; pvTitle.textContent=r.title; pvMeta.textContent=r.channel+' · '+r.uploaded;
+        pvBadges.innerHTML = '<span class="badge">Views: '+fmtInt(r.views)+'</span>'
+          + '<span class="badge">VPH: '+fmtNum(r.vph)+'</span>'
+          + '<span class="badge">Subs: '+fmtInt(r.subs)+'</span>'
+          + (r.vs!=null?'<span class="badge">V/Sub: '+r.vs+'</span>':'')
+          + '<span class="badge">Dur: '+r.duration+'</span>';
+        pvLink.innerHTML = '<a href="'+r.url+'" target="_blank" rel="noreferrer">▶ Open on YouTube</a>';
+      }, {passive:true});
+    });
+  }
+  renderBody();
+
+  if(rows.length){
+    const r=rows[0]; pvImg.src=r.thumb; pvTitle.textContent=r.title; pvMeta.textContent=r.channel+' · '+r.uploaded;
+    pvBadges.innerHTML = '<span class="badge">Views: '+fmtInt(r.views)+'</span>'
+      + '<span class="badge">VPH: '+fmtNum(r.vph)+'</span>'
+      + '<span class="badge">Subs: '+fmtInt(r.subs)+'</span>'
+      + (r.vs!=null?'<span class="badge">V/Sub: '+r.vs+'</span>':'')
+      + '<span class="badge">Dur: '+r.duration+'</span>';
+    pvLink.innerHTML = '<a href="'+r.url+'" target="_blank" rel="noreferrer">▶ Open on YouTube</a>';
+  }
+})();
+</script>
+"""
+# 템플릿은 import 시 1회만 __DATA__ 기준으로 분할 — 매 빌드마다 수 KB 템플릿을
+# 다시 스캔하지 않고, 대형 JSON 페이로드는 join으로 한 번만 이어붙인다
+_TPL_HEAD, _TPL_TAIL = _COMPONENT_TPL.split("__DATA__", 1)
+
+def build_component_html(payload: List[Dict[str, Any]], show_ko: bool = True, tooltip_ko: bool = True) -> str:
+    data_json = _dumps(payload).replace("</", "<\\/")
+    tail = (_TPL_TAIL
+            .replace("__SHOW_KO__", "true" if show_ko else "false")
+            .replace("__TOOLTIP_KO__", "true" if tooltip_ko else "false"))
+    return "".join((_TPL_HEAD, data_json, tail))
+
+# 페이로드/HTML 조립은 행 내용 기준으로 캐시 — 수동 무효화 로직 불필요
+@st.cache_data(show_spinner=False)
+def _make_payload(rows: List[Dict[str, Any]], translate_titles: bool) -> List[Dict[str, Any]]:
+    payload: List[Dict[str, Any]] = []
+    for r in rows:
+        # 필요할 때만 번역(캐시됨)
+        title_ko = translate_to_ko_once(r["Video Title"]) if translate_titles else ""
+        payload.append({
+            "channel": r["Channel"], "title": r["Video Title"], "title_ko": title_ko,
+            "uploaded": r["Uploaded"], "uploaded_ts": float(r["_Uploaded_ts"]),
+            "views": int(r["Views"]), "vph": float(r["Views/hr"]),
+            "subs": int(r["Subscribers"]),
+            "vs": (float(r["Views/Subscribers"]) if r["Views/Subscribers"] is not None else None),
+            "duration": r["Duration"], "duration_sec": float(r["_Duration_sec"]),
+            "url": f"https://www.youtube.com/watch?v={r['_vid']}",
+            "vid": r["_vid"], "thumb": r["_thumb"],
+        })
+    return payload
+
+@st.cache_data(show_spinner=False)
+def _make_html(payload: List[Dict[str, Any]], show_ko: bool, tooltip_ko: bool) -> str:
+    return build_component_html(payload, show_ko=show_ko, tooltip_ko=tooltip_ko)
+
+@st.cache_data(show_spinner=False)
+def to_excel(rows: List[Dict[str, Any]]) -> bytes:
+    """행 목록을 xlsx 바이트로 직렬화 (행 내용 기준 캐시).
+
+    xlsxwriter가 있으면 우선 사용(대형 시트에서 openpyxl 대비 수 배 빠름),
+    없으면 openpyxl 폴백. constant_memory 모드는 쓰지 않는다 — pandas가
+    셀을 열 우선으로 기록하는데, 그 모드는 이미 지나간 행 쓰기를 조용히
+    버려서 둘째 열부터 데이터가 유실된다.
+    """
+    from io import BytesIO
+    out = BytesIO()
+    # DataFrame은 내보내기 시점에만 생성 — URL 컬럼은 여기서 _vid로부터 복원
+    export_df = pd.DataFrame.from_records(rows)
+    if "_vid" in export_df.columns:
+        export_df["URL"] = "https://www.youtube.com/watch?v=" + export_df["_vid"].astype(str)
+    export_df = export_df.drop(
+        columns=["_Uploaded_ts", "_Duration_sec", "_vid", "_thumb"], errors="ignore")
+    try:
+        import xlsxwriter  # noqa: F401
+        engine = "xlsxwriter"
+    except Exception:
+        try:
+            import openpyxl  # noqa: F401
+        except Exception:
+            bio = BytesIO(); bio.write(b"Install xlsxwriter: pip install xlsxwriter"); return bio.getvalue()
+        engine = "openpyxl"
+    with pd.ExcelWriter(out, engine=engine) as writer:
+        export_df.to_excel(writer, index=False, sheet_name="HotVideos")
+    return out.getvalue()
+
+# -----------------------------------------------------------------------------
+# Transcript helpers
+# -----------------------------------------------------------------------------
+# youtube_transcript_api — 선택 의존성, 최초 사용 시 1회만 import
+_YTA = None
+
+def _get_yta():
+    global _YTA
+    if _YTA is None:
+        try:
+            from youtube_transcript_api import YouTubeTranscriptApi
+            _YTA = YouTubeTranscriptApi
+        except Exception:
+            _YTA = False  # import 실패 기억 — 재시도 안 함
+    return _YTA or None
+
+def _format_srt_time(seconds: float) -> str:
+    ms = int(round((seconds - int(seconds)) * 1000))
+    total = int(seconds)
+    h = total // 3600
+    m = (total % 3600) // 60
+    s = total % 60
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_transcript_srt(video_id: str, lang_pref: str = "ko") -> Optional[str]:
+    YouTubeTranscriptApi = _get_yta()
+    if YouTubeTranscriptApi is None:
+        return None
+    langs = []
+    if lang_pref:
+        langs.append(lang_pref)
+        if "-" in lang_pref:
+            langs.append(lang_pref.split("-")[0])
+    for extra in ["en", "ko"]:
+        if extra not in langs:
+            langs.append(extra)
+    try:
+        list_obj = YouTubeTranscriptApi.list_transcripts(video_id)
+        segs = None
+        for lp in langs:
+            try:
+                tr = list_obj.find_transcript([lp])
+                segs = tr.fetch()
+                break
+            except Exception:
+                pass
+        if segs is None:
+            try:
+                tr = list_obj.find_transcript(list_obj._generated_transcripts_language_codes)
+                tr = tr.translate(langs[0]); segs = tr.fetch()
+            except Exception:
+                return None
+    except Exception:
+        return None
+
+    lines = []
+    for idx, seg in enumerate(segs, start=1):
+        start = float(seg.get("start", 0.0)); dur = float(seg.get("duration", 0.0)); end = start + dur
+        text = (seg.get("text") or "").replace("\n", " ").strip()
+        lines.append(str(idx)); lines.append(f"{_format_srt_time(start)} --> {_format_srt_time(end)}")
+        lines.append(text if text else ""); lines.append("")
+    return "\n".join(lines) if lines else None
+
+def _safe_filename(s: str) -> str:
+    bad = '<>:"/\\|?*'
+    out = "".join(c for c in s if c not in bad)
+    return out[:120].strip() or "video"
+
+@st.cache_data(show_spinner=False)
+def build_transcripts_zip_cached(vids: Tuple[str, ...], labels: Tuple[str, ...], lang_pref: str) -> bytes:
+    from io import BytesIO; import zipfile
+    # 자막 HTTP 요청은 병렬로, zip 쓰기는 단일 스레드로 (zipfile은 동시 쓰기 불가)
+    srts = _run_parallel(lambda v: fetch_transcript_srt(v, lang_pref=lang_pref), vids, max_workers=16)
+    buf = BytesIO(); missing = []
+    # SRT는 작은 텍스트라 압축률보다 속도 우선 (compresslevel=1)
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for label, srt in zip(labels, srts):
+            if srt:
+                fn = _safe_filename(label)[:100] + ".srt"; zf.writestr(fn, srt)
+            else:
+                missing.append(label)
+        if missing:
+            zf.writestr("README.txt", "No transcript for:\n\n" + "\n".join(f"- {m}" for m in missing))
+    return buf.getvalue()
+
+# -----------------------------------------------------------------------------
+# UI
+# -----------------------------------------------------------------------------
+st.title("🔥 YouTube Hot Finder")
+
+# Live quota header
+quota_box = st.container()
+
+# Streamlit ≥1.33이면 fragment로 감싸 헤더만 독립 rerun — 페이지 전체를 다시
+# 그리지 않아도 쿼터 표시가 갱신된다 (구버전에서는 그대로 일반 함수)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def render_quota_header():
+    used = st.session_state["q_units"]
+    left = max(DEFAULT_DAILY_QUOTA - used, 0)
+    p = min(used / DEFAULT_DAILY_QUOTA, 1.0)
+    with quota_box:
+        st.progress(p, text=f"일일 쿼터 사용량: {used:,} / {DEFAULT_DAILY_QUOTA:,}  (남음 {left:,})")
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("search.list calls", f"{st.session_state['q_calls']['search']}")
+        c2.metric("videos.list calls", f"{st.session_state['q_calls']['videos']}")
+        c3.metric("channels.list calls", f"{st.session_state['q_calls']['channels']}")
+        c4.metric("총 유닛", f"{used:,}")
+
+if _fragment is not None:
+    render_quota_header = _fragment(render_quota_header)
+render_quota_header()
+
+tab_input, tab_settings, tab_results = st.tabs(["키워드·채널 입력", "설정", "결과"])
+
+# ----------------------- Input Tab -----------------------
+with tab_input:
+    st.subheader("키워드 / 채널핸들 입력")
+
+    col_sel1, col_sel2, col_chk = st.columns([0.25, 0.25, 0.5])
+    with col_sel1:
+        st.selectbox("입력 언어", ["ko", "en", "ja", "zh", "es", "de", "fr", "pt"], index=0, key="live_src")
+    with col_sel2:
+        st.selectbox("변환 언어", ["ja", "ko", "en", "zh", "es", "de", "fr", "pt"], index=0, key="live_dst")
+    with col_chk:
+        st.checkbox("번역본을 검색에 사용(원문 대신)", value=True, key="live_replace")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.text_area("키워드(원문: 쉼표/스페이스/줄바꿈 구분)", key="kw_src", height=80, placeholder="예: 시니어, 황혼")
+
+    src_list = parse_list_field(st.session_state.get("kw_src", ""))
+    dst_list = translate_keywords_list(src_list, st.session_state["live_src"], st.session_state["live_dst"])
+    with c2:
+        st.text_area(f"키워드(변환: {st.session_state['live_dst']})", value=", ".join(dst_list), height=80, disabled=True)
+
+    st.session_state["effective_keywords"] = dst_list if st.session_state["live_replace"] else src_list
+    st.session_state["effective_lang"] = st.session_state["live_dst"] if st.session_state["live_replace"] else st.session_state["live_src"]
+
+    st.text_area("채널 핸들 또는 채널 ID (쉼표/스페이스/줄바꿈 구분)", key="channels_input", height=80, placeholder="@channel 또는 UCxxxxx")
+
+# ----------------------- Settings Tab -----------------------
+with tab_settings:
+    st.subheader("설정")
+
+    # --- API 키 입력/관리 ---
+    current_keys = st.session_state.get("api_keys", [])
+    current_display = ",".join(current_keys) if current_keys else st.session_state.get("api_key", "")
+    user_key = st.text_input(
+        "YouTube Data API v3 키 (쉼표로 여러 개 입력 가능)",
+        value=str(current_display),
+        type="password",
+        key="api_key_input",
+        help="예) key1,key2,key3  → 쿼터 초과 시 자동 로테이션"
+    )
+
+    # 입력값 반영 (쉼표 분리 다중키 지원)
+    if user_key is not None:
+        parsed = [k.strip() for k in user_key.split(",") if k.strip()]
+        if parsed:
+            st.session_state["api_keys"] = parsed
+            st.session_state["api_key_idx"] = 0
+            st.session_state["api_key"] = parsed[0]
+        else:
+            st.session_state["api_keys"] = []
+            st.session_state["api_key_idx"] = 0
+            st.session_state["api_key"] = ""
+
+    c1, c2, c3 = st.columns([0.25, 0.25, 0.5])
+    if c1.button("API 키 저장"):
+        if st.session_state.get("api_key", ""):
+            ok = save_api_key_to_disk(st.session_state["api_key"])
+            st.success("로컬에 저장했습니다." if ok else "저장 실패")
+        else:
+            st.warning("저장할 키가 없습니다.")
+    if c2.button("API 키 삭제"):
+        ok = delete_api_key_on_disk()
+        if ok:
+            st.session_state["api_keys"] = []
+            st.session_state["api_key_idx"] = 0
+            st.session_state["api_key"] = ""
+            st.success("로컬 저장 키를 삭제했습니다.")
+        else:
+            st.warning("삭제 실패 또는 저장된 키가 없습니다.")
+    c3.caption(f"로컬 저장 위치: `{CONFIG_PATH}` (개인 PC 외 저장은 권장하지 않음)")
+
+    # 검색/필터 옵션
+    st.selectbox("실행모드", ["채널", "키워드", "둘다"], index=2, key="run_mode")
+    st.selectbox("쇼츠/롱폼", ["쇼츠", "롱폼", "둘다"], key="form_factor")
+    st.number_input("쇼츠 기준(초)", min_value=10, max_value=300, value=60, step=5, key="shorts_sec")
+    st.number_input("최근 몇일간의 영상을 분석할까요", min_value=1, max_value=3650, value=180, key="days_back")
+    st.number_input("채널당 최대 검색 수", min_value=10, max_value=1000, value=200, step=10, key="per_channel_max")
+    st.number_input("검색어당 최대 검색수", min_value=10, max_value=1000, value=200, step=10, key="per_keyword_max")
+    st.number_input("최소 시간당 조회수", min_value=0.0, value=0.0, step=10.0, key="min_vph")
+    st.number_input("API키 쿼터 소진 시 대기시간(분)", min_value=0.0, value=0.0, step=0.5, key="wait_minutes")
+    st.checkbox("테스트용: 길이/시간당 조회수 필터 무시", value=False, key="ignore_filters")
+
+    # 국가 범위만 선택(심플)
+    st.markdown("### 🌐 국가 범위")
+    scope = st.radio("검색 범위", ["한국만", "해외만", "한국+해외"], index=2, horizontal=True, key="region_scope")
+    overseas_regions = []
+    if scope in ("해외만", "한국+해외"):
+        overseas_regions = st.multiselect("해외 국가 선택", options=FOREIGN_PRESET, default=FOREIGN_PRESET, key="overseas_regions")
+    target_regions = (["KR"] if scope in ("한국만", "한국+해외") else []) + (overseas_regions if scope in ("해외만", "한국+해외") else [])
+    st.session_state["target_regions"] = target_regions
+
+    # 키워드 엄격 필터 옵션
+    st.markdown("**키워드 정확도 옵션**")
+    st.checkbox("키워드 엄격 필터링 (제목/설명/태그 검사)", value=True, key="kw_strict_on")
+    st.radio("매칭 방식", options=["하나 이상 포함(권장)", "모두 포함(엄격)"], index=0, horizontal=True, key="kw_strict_mode")
+
+    # Quota Estimator (대략)
+    st.subheader("🔢 쿼터 예상 소모량")
+    def _parse_for_estimator(txt: Optional[str]) -> List[str]:
+        return parse_list_field(txt)
+    ch_list = _parse_for_estimator(st.session_state.get("channels_input", "")) if st.session_state["run_mode"] in ("채널", "둘다") else []
+    kw_list = st.session_state.get("effective_keywords", []) if st.session_state["run_mode"] in ("키워드", "둘다") else []
+    est_videos = len(ch_list) * st.session_state["per_channel_max"] + len(kw_list) * st.session_state["per_keyword_max"]
+    search_calls = len(ch_list) * math.ceil(st.session_state["per_channel_max"] / 50) + len(kw_list) * math.ceil(st.session_state["per_keyword_max"] / 50)
+    search_units = search_calls * 100
+    videos_calls = math.ceil(est_videos / 50) if est_videos else 0
+    videos_units = videos_calls * 1
+    chan_calls_min = math.ceil((len(ch_list) or 0) / 50) if est_videos else 0
+    chan_calls_max = math.ceil(est_videos / 50) if est_videos else 0
+    chan_units_min = chan_calls_min * 1
+    chan_units_max = chan_calls_max * 1
+    total_units_min = search_units + videos_units + chan_units_min
+    total_units_max = search_units + videos_units + chan_units_max
+    quota = DEFAULT_DAILY_QUOTA
+    warn = total_units_max > quota
+
+    cA, cB, cC, cD = st.columns(4)
+    cA.metric("search.list(100/u)", f"{search_units:,}", f"{search_calls} calls")
+    cB.metric("videos.list(1/u)", f"{videos_units:,}", f"{videos_calls} calls")
+    cC.metric("channels.list(1/u)", f"{chan_units_min:,} ~ {chan_units_max:,}", f"{chan_calls_min}~{chan_calls_max} calls")
+    cD.metric("총 예상(최소~최대)", f"{total_units_min:,} ~ {total_units_max:,}", f"일일 한도 {quota:,}")
+
+    if not warn:
+        st.success("대부분 한도 내에서 동작합니다.")
+    else:
+        st.error("최대 추정 사용량이 일일 한도를 초과할 수 있습니다. 검색 개수/키워드/채널 수를 조정하세요.")
+
+    col_run, col_clear = st.columns([0.25, 0.25])
+    run = col_run.button("시작하기", type="primary", key="run_btn")
+    clear = col_clear.button("결과 지우기", key="clear_btn")
+    if clear:
+        st.session_state["rows_state"] = []
+        st.experimental_rerun()
+
+# ----------------------- Main run -----------------------
+if 'run' in locals() and run:
+    api_key = st.session_state.get("api_key", "")
+    if not api_key:
+        st.error("설정 탭에서 API 키를 입력하세요.")
+        st.stop()
+
+    # 지난 런의 '소진' 기록은 버린다 — 일일 쿼터가 그새 리셋됐을 수 있다
+    st.session_state["quota_exhausted_idx"] = set()
+
+    run_mode = st.session_state["run_mode"]
+    form_factor = st.session_state["form_factor"]
+    shorts_sec = int(st.session_state["shorts_sec"])
+    days_back = int(st.session_state["days_back"])
+    per_channel_max = int(st.session_state["per_channel_max"])
+    per_keyword_max = int(st.session_state["per_keyword_max"])
+    min_vph = float(st.session_state["min_vph"])
+    wait_minutes = float(st.session_state["wait_minutes"])
+    ignore_filters = bool(st.session_state["ignore_filters"])
+    target_regions = st.session_state.get("target_regions", ["KR"])
+
+    strict_on = bool(st.session_state["kw_strict_on"])
+    strict_mode_val = st.session_state["kw_strict_mode"]
+    strict_mode_key = "all" if strict_mode_val == "모두 포함(엄격)" else "any"
+
+    base_keywords = st.session_state.get("effective_keywords", [])
+    effective_lang = st.session_state.get("effective_lang", "ko")
+
+    input_channels = parse_list_field(st.session_state.get("channels_input", "")) if run_mode in ("채널", "둘다") else []
+
+    if len(input_channels) == 0 and len(base_keywords) == 0:
+        st.error("실행모드에 맞게 채널 또는 키워드를 최소 1개 이상 입력하세요.")
+        st.stop()
+
+    with st.spinner("검색 중…"):
+        # 시 단위로 내림 — 마이크로초가 캐시 키(_cached_search/yt_get_cached)에
+        # 섞이면 동일 설정 rerun도 매번 캐시를 빗나가 search 쿼터를 다시 쓴다
+        _since = datetime.utcnow() - timedelta(days=days_back)
+        published_after = _since.replace(minute=0, second=0, microsecond=0).isoformat("T") + "Z"
+
+        def resolve_channel_ids(lst: List[str]) -> List[str]:
+            # @핸들 조회도 각각 한 번의 yt_get — 병렬로 해석한다
+            def _resolve(token: str) -> Optional[str]:
+                if not token.startswith("@"):
+                    return token
+                data = yt_get_cached("search", {"part": "snippet", "type": "channel", "q": token, "maxResults": 1}, api_key, wait_minutes=wait_minutes)
+                items = data.get("items", [])
+                ch_id = items[0]["snippet"].get("channelId") if items else None
+                if not ch_id and items:
+                    ch_id = items[0]["id"].get("channelId")
+                return ch_id
+            return [c for c in _run_parallel(_resolve, lst) if c]
+
+        channels = resolve_channel_ids(input_channels) if run_mode in ("채널", "둘다") else []
+
+        # region × 채널/키워드 조합을 작업 목록으로 펼쳐 스레드 풀에서 동시 검색.
+        # QPS 제어는 yt_get의 토큰 버킷이 담당하므로 per-call sleep은 불필요.
+        search_jobs: List[Dict[str, Any]] = []
+
+        # 채널 모드 — 채널의 업로드 목록은 전역적으로 동일하므로 region 루프를 돌지
+        # 않는다 (regionCode는 키워드 검색의 관련도에만 의미가 있음). 쿼터 N배 절감.
+        if run_mode in ("채널", "둘다"):
+            for ch in channels:
+                search_jobs.append(dict(channel_id=ch, region_code=None,
+                                        max_results=per_channel_max, order="date"))
+
+        # 키워드 모드
+        if run_mode in ("키워드", "둘다"):
+            for region in target_regions:
+                for kw in base_keywords:
+                    if not kw:
+                        continue
+                    search_jobs.append(dict(query=kw, region_code=region,
+                                            max_results=per_keyword_max, order="viewCount"))
+
+        def _search(job: Dict[str, Any]) -> List[str]:
+            return _cached_search(
+                query=job.get("query"), channel_id=job.get("channel_id"),
+                region_code=job["region_code"], relevance_language=effective_lang,
+                published_after=published_after, max_results=job["max_results"],
+                order=job["order"], _api_key=api_key, _wait_minutes=wait_minutes,
+            )
+
+        # 워커별 결과 리스트를 마지막에 한 번에 union (공유 set 잠금 불필요)
+        collected_ids = set().union(*_run_parallel(_search, search_jobs)) if search_jobs else set()
+
+        st.info(f"수집된 비디오 ID 수: {len(collected_ids)}")
+
+        details = _cached_video_details(tuple(sorted(collected_ids)), api_key, wait_minutes)
+        st.info(f"상세 조회된 비디오 수: {len(details)}")
+
+        # 엄격 필터용 키워드
+        all_keywords_norm = [normalize_text(k) for k in base_keywords]
+
+        # 필터를 먼저 적용하고, 살아남은 영상의 채널만 구독자 조회
+        # — 탈락률만큼 channels.list 쿼터를 아낀다
+        df_filtered = filter_details_frame(
+            details,
+            form_factor=form_factor, shorts_sec=int(shorts_sec),
+            min_vph=float(min_vph), ignore_filters=ignore_filters,
+            strict_keywords=all_keywords_norm if strict_on else [],
+            strict_mode=strict_mode_key,
+        )
+        channel_ids = set(df_filtered["_ch"]) if not df_filtered.empty else set()
+        subs_map = _cached_channel_subs(tuple(sorted(channel_ids)), api_key, wait_minutes) if channel_ids else {}
+
+        # 파생 컬럼·포맷까지 전부 벡터 연산으로 행 목록 생성
+        rows = assemble_rows(df_filtered, subs_map)
+
+        st.session_state["rows_state"] = rows
+
+# ----------------------- Results tab -----------------------
+with tab_results:
+    st.subheader("결과")
+
+    # ▼ 새 옵션: 제목 한국어 번역 표시/툴팁
+    show_title_ko = st.checkbox("제목 아래 한국어 번역 표시", value=True, key="show_title_ko")
+    tooltip_title_ko = st.checkbox("제목에 마우스 오버 시 한국어 툴팁", value=True, key="tooltip_title_ko")
+
+    rows_state = st.session_state.get("rows_state", [])
+    if not rows_state:
+        st.info("아직 결과가 없습니다. 설정 탭에서 ‘시작하기’를 눌러 검색해 주세요.")
+    else:
+        st.success(f"{len(rows_state)}개 결과")
+        rows_sorted = sort_rows(rows_state)
+
+        payload = _make_payload(rows_sorted, show_title_ko or tooltip_title_ko)
+
+        # 현재 페이지(50행)만 컴포넌트로 전송 — DOM 크기와 직렬화 비용을 N/50로 축소
+        page_size = 50
+        n_pages = max(math.ceil(len(payload) / page_size), 1)
+        if n_pages > 1:
+            if int(st.session_state.get("results_page", 1)) > n_pages:
+                st.session_state["results_page"] = n_pages
+            page = int(st.number_input(f"페이지 (총 {n_pages}페이지, {page_size}행씩)",
+                                       min_value=1, max_value=n_pages, step=1, key="results_page"))
+        else:
+            page = 1
+        page_payload = payload[(page - 1) * page_size : page * page_size]
+
+        html = _make_html(page_payload, show_title_ko, tooltip_title_ko)
+        components.html(html, height=680, scrolling=False)
+
+        xlsx = to_excel(rows_sorted)
+        st.download_button("Download Excel", data=xlsx,
+                           file_name="youtube_hot_finder.xlsx",
+                           mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+        # Transcripts
+        st.markdown("### 📝 Transcripts 다운로드 (공개 자막이 있는 영상만)")
+        transcripts_available = _get_yta() is not None
+        if not transcripts_available:
+            st.info("Transcript 기능을 사용하려면 다음을 설치하세요:\n\n`pip install youtube-transcript-api`")
+
+        if transcripts_available:
+            # 라벨 리스트는 rerun당 1회만 조립하고, 멀티셀렉트 옵션은 인덱스로 —
+            # O(N) 한국어 제목 문자열 리스트를 위젯 옵션으로 반복 생성하지 않는다
+            labels = [f"{r['Video Title']}  —  ({r['Channel']}) [{r['_vid']}]" for r in rows_sorted]
+            vids_by_idx = [r["_vid"] for r in rows_sorted]
+            stored = st.session_state.get("transcript_selection_idx")
+            if stored is None:
+                st.session_state["transcript_selection_idx"] = list(range(min(50, len(labels))))
+            else:
+                # 새 검색으로 결과가 줄었을 때 범위를 벗어난 선택은 정리
+                st.session_state["transcript_selection_idx"] = [i for i in stored if i < len(labels)]
+            select_idx = st.multiselect("대본을 받을 영상 선택", options=list(range(len(labels))),
+                                        format_func=lambda i: labels[i], key="transcript_selection_idx")
+            lang_pref = st.text_input("우선 언어(예: ko, en, ko-KR)", value=st.session_state.get("lang_pref", "ko"), key="lang_pref")
+
+            col_srt, col_zip = st.columns([0.5, 0.5])
+            with col_srt:
+                st.write("**개별 SRT 다운로드**")
+                if select_idx:
+                    sel = select_idx[:30]
+                    sel_vids = [vids_by_idx[i] for i in sel]
+                    # 자막을 병렬로 프리페치 — 아래 루프의 개별 호출은 캐시 히트로 즉시 반환
+                    srt_map = dict(zip(sel_vids, _run_parallel(
+                        lambda v: fetch_transcript_srt(v, lang_pref=lang_pref),
+                        sel_vids, max_workers=6)))
+                    for i in sel:
+                        label = labels[i]
+                        vid = vids_by_idx[i]
+                        srt = srt_map[vid]
+                        if srt:
+                            fn = _safe_filename(label)[:100] + ".srt"
+                            st.download_button("⬇️ " + fn, data=srt.encode("utf-8"),
+                                               file_name=fn, mime="application/x-subrip", key=f"srt_{vid}")
+                        else:
+                            st.caption(f"• `{label}` : 공개 자막 없음 / 가져오기 실패")
+                else:
+                    st.caption("선택된 항목이 없습니다.")
+            with col_zip:
+                st.write("**선택 항목 ZIP 일괄 다운로드**")
+                if select_idx:
+                    labels_tuple = tuple(labels[i] for i in select_idx)
+                    vids_tuple = tuple(vids_by_idx[i] for i in select_idx)
+                    zip_bytes = build_transcripts_zip_cached(vids_tuple, labels_tuple, lang_pref)
+                    st.download_button("⬇️ transcripts_selected.zip", data=zip_bytes,
+                                       file_name="transcripts_selected.zip", mime="application/zip",
+                                       key="zip_selected")
+                else:
+                    st.caption("선택된 항목이 없습니다.")
+
+st.markdown("---")
+st.caption("입력 탭에서 다국어 키워드를 미리보고, 설정 탭에서는 국가 범위만 고르면 됩니다. 제목·설명·태그 기반 엄격 필터도 유지됩니다.")